@@ -24,6 +24,8 @@ Dependencies:
 - os: Directory creation operations
 """
 
+import re
+
 from ttkbootstrap.toast import ToastNotification
 
 
@@ -32,19 +34,26 @@ DEBUG = False
 Version_Number = "1.0.6.8"
 Version = f"v{Version_Number}"
 
+# Toast notification icons, keyed by toast kind
+_ICONS = {"happy": "😀", "sad": "😟", "angry": "🤬"}
+
+# Tk geometry string: "widthxheight" with optional "+x+y" (offsets may be
+# negative, e.g. "+-8")
+_GEOM_RE = re.compile(r"(\d+)x(\d+)(?:\+(-?\d+)\+(-?\d+))?")
+
+# Screen dimensions per Tk window, queried once per session
+_SCREEN_CACHE = {}
+
 
 # Generic utility functions and constants
 
 
-def show_toast(title, message, type="happy"):
+def show_toast(title, message, kind="happy"):
     """Show a toast notification."""
-    icons = {"happy": "😀", "sad": "😟", "angry": "🤬"}
-    icon = icons.get(type, icons["happy"])
-
     toast = ToastNotification(
         title=title,
         message=message,
-        icon=icon,
+        icon=_ICONS.get(kind, _ICONS["happy"]),
         duration=10000,
     )
     toast.show_toast()
@@ -64,18 +73,22 @@ def calculate_analytics_window_position(parent_window):
     try:
         # Get main window geometry
         geometry = parent_window.geometry()
-        # Parse geometry string: "widthxheight+x+y"
-        size_pos = geometry.split("+")
-        width_height = size_pos[0].split("x")
-
-        main_width = int(width_height[0])
-        main_height = int(width_height[1])
-        main_x = int(size_pos[1]) if len(size_pos) > 1 else 0
-        main_y = int(size_pos[2]) if len(size_pos) > 2 else 0
-
-        # Get screen dimensions
-        screen_width = parent_window.winfo_screenwidth()
-        screen_height = parent_window.winfo_screenheight()
+        match = _GEOM_RE.fullmatch(geometry)
+        if not match:
+            raise ValueError(f"Unexpected geometry string: {geometry}")
+        main_width, main_height, main_x, main_y = (
+            int(value or 0) for value in match.groups()
+        )
+
+        # Get screen dimensions (cached - they don't change during a session)
+        key = id(parent_window)
+        dims = _SCREEN_CACHE.get(key)
+        if dims is None:
+            dims = _SCREEN_CACHE[key] = (
+                parent_window.winfo_screenwidth(),
+                parent_window.winfo_screenheight(),
+            )
+        screen_width, screen_height = dims
 
         # Analytics window dimensions
         analytics_width = 420  # Slightly wider for better display
@@ -26,7 +26,6 @@ Features:
 
 Dependencies:
 - ttkbootstrap: Modern GUI framework
-- PIL (Pillow): Image processing for icons
 - tkinter: Base GUI framework components
 - Functions: Shared utility functions
 - ffmpeg_encoder: Core encoding functionality
@@ -34,47 +33,223 @@ Dependencies:
 - settings_manager: Configuration persistence
 """
 
-import io
 import os
-import base64
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import tkinter as tk
+from dataclasses import replace
+from functools import partial
 from tkinter import filedialog, messagebox
+from tkinter import font as tkfont
 import ttkbootstrap as ttk
-from ttkbootstrap.constants import SUCCESS, WARNING, DISABLED
-from PIL import Image, ImageTk
+from ttkbootstrap.constants import DISABLED
 from Functions import DEBUG, show_toast
 from icon import himage
 from ffmpeg_encoder import FFMPEGEncoder, EncodingSettings
-from thread_manager import ThreadManager
-from openai_analyzer import OpenAIVideoAnalyzer
 from settings_manager import SettingsManager
 
+# Themed widget styles referenced by name across the GUI
+_WIDGET_STYLES = (
+    "success.TCheckbutton",
+    "success.TButton",
+    "warning.TButton",
+    "Accent.TButton",
+)
+
+# Shared named fonts: (Tk font name, family, size, weight)
+_FONT_SPECS = (
+    ("HoffTitle16", "Arial", 16, "bold"),
+    ("HoffSection14", "Arial", 14, "bold"),
+    ("HoffHeading10", "Arial", 10, "bold"),
+    ("HoffBody10", "Arial", 10, "normal"),
+    ("HoffBold9", "Arial", 9, "bold"),
+    ("HoffNormal9", "Arial", 9, "normal"),
+    ("HoffSmall8", "Arial", 8, "normal"),
+)
+_TITLE_FONT = "HoffTitle16"
+_SECTION_FONT = "HoffSection14"
+_HEADING_FONT = "HoffHeading10"
+_BODY_FONT = "HoffBody10"
+_BOLD_FONT = "HoffBold9"
+_NORMAL_FONT = "HoffNormal9"
+_SMALL_FONT = "HoffSmall8"
+
+# Named label styles - Tk resolves each font once per style, not per widget
+_LABEL_STYLES = (
+    ("Title.TLabel", _TITLE_FONT),
+    ("Section.TLabel", _SECTION_FONT),
+    ("Heading.TLabel", _HEADING_FONT),
+    ("Body.TLabel", _BODY_FONT),
+    ("InfoBold.TLabel", _BOLD_FONT),
+    ("Info.TLabel", _NORMAL_FONT),
+    ("Small.TLabel", _SMALL_FONT),
+)
+
+# Combobox choices - built once at import and shared by every widget
+_VIDEO_CODEC_VALUES = tuple(FFMPEGEncoder.VIDEO_CODECS)
+_PRESET_VALUES = tuple(FFMPEGEncoder.PRESETS)
+_VIDEO_BITRATE_VALUES = ("Auto", "1000k", "2000k", "4000k", "8000k", "16000k")
+_RESOLUTION_VALUES = tuple(FFMPEGEncoder.RESOLUTIONS)
+_FPS_VALUES = ("Original", "24", "30", "60")
+_AUDIO_CODEC_VALUES = tuple(FFMPEGEncoder.AUDIO_CODECS)
+_CHANNEL_VALUES = ("Original", "1", "2")
+_AUDIO_BITRATE_VALUES = ("Auto", "64k", "128k", "192k", "256k", "320k")
+_SAMPLE_RATE_VALUES = ("Original", "22050", "44100", "48000")
+_OUTPUT_FORMAT_VALUES = ("mp4", "mkv", "avi", "webm")
+
+# GUI variable -> EncodingSettings field bindings
+_CODEC_BINDINGS = (
+    ("video_codec_var", "video_codec", "VIDEO_CODECS", "libx264"),
+    ("audio_codec_var", "audio_codec", "AUDIO_CODECS", "aac"),
+)
+_SETTINGS_BINDINGS = (
+    ("video_bitrate_var", "video_bitrate"),
+    ("resolution_var", "resolution"),
+    ("fps_var", "fps"),
+    ("crf_var", "crf"),
+    ("preset_var", "preset"),
+    ("audio_bitrate_var", "audio_bitrate"),
+    ("audio_sample_rate_var", "audio_sample_rate"),
+    ("audio_channels_var", "audio_channels"),
+    ("output_format_var", "output_format"),
+    ("output_dir_var", "output_directory"),
+    ("copy_matching_var", "copy_matching_streams"),
+)
+
+# Persisted settings as (Tk variable attribute, AppSettings field)
+_AI_SETTINGS_FIELDS = (
+    ("openai_api_key_var", "openai_api_key"),
+    ("ai_encoding_var", "ai_encoding_enabled"),
+)
+# Only saved/restored while AI encoding is off
+_MANUAL_SETTINGS_FIELDS = (
+    ("video_codec_var", "video_codec"),
+    ("video_bitrate_var", "video_bitrate"),
+    ("resolution_var", "resolution"),
+    ("fps_var", "fps"),
+    ("crf_var", "crf"),
+    ("preset_var", "preset"),
+    ("audio_codec_var", "audio_codec"),
+    ("audio_bitrate_var", "audio_bitrate"),
+    ("audio_sample_rate_var", "audio_sample_rate"),
+    ("audio_channels_var", "audio_channels"),
+)
+_OUTPUT_SETTINGS_FIELDS = (
+    ("output_format_var", "output_format"),
+    ("output_dir_var", "output_directory"),
+    ("maintain_structure_var", "maintain_structure"),
+    ("copy_matching_var", "copy_matching_streams"),
+    ("parallel_jobs_var", "parallel_jobs"),
+    ("segment_encode_var", "segment_encode"),
+    ("processing_mode", "processing_mode"),
+)
+
+# Video info fields laid out two per row: (label, key, row, first column)
+_INFO_ITEMS = (
+    ("Filename:", "filename"),
+    ("Duration:", "duration"),
+    ("Resolution:", "resolution"),
+    ("Aspect Ratio:", "aspect_ratio"),
+    ("Video Codec:", "video_codec"),
+    ("Audio Codec:", "audio_codec"),
+    ("Bitrate:", "bitrate"),
+    ("File Size:", "file_size"),
+)
+_INFO_LAYOUT = tuple(
+    (label_text, key, i // 2, (i % 2) * 2)
+    for i, (label_text, key) in enumerate(_INFO_ITEMS)
+)
+
+# System tab placeholders before detection: (column, row, title, text)
+_EMPTY_SYSTEM_SECTIONS = (
+    (0, 0, "🖥️ CPU & Memory", "No system detection performed"),
+    (0, 1, "🧠 System Memory", "Memory info will appear here"),
+    (1, 0, "🎮 GPU & Graphics", "GPU detection pending"),
+    (1, 1, "⚡ Hardware Acceleration", "Acceleration support will be shown here"),
+    (2, 0, "⚡ Performance Settings", "Optimal settings will appear here"),
+    (2, 1, "📊 Quick Summary", "Click 'Detect System Capabilities' to begin"),
+)
+
+# Auto-save waits this long for further changes before writing settings
+_AUTOSAVE_DELAY_MS = 500
+_MAX_GPUS_SHOWN = 3  # Further GPUs collapse into a clickable "+N more" label
+
+# Worker -> GUI update queue polling
+_UI_QUEUE_INTERVAL_MS = 50
+_UI_QUEUE_BATCH = 100
+_SCAN_BATCH = 100
+# Probe warm-up after a folder scan: the first few files, a few at a time
+_WARM_PROBE_LIMIT = 64
+_WARM_PROBE_WORKERS = 4
+
+
+def _get_icon_photo(window):
+    """Return the window's icon PhotoImage, loading the base64 PNG only once."""
+    photo = getattr(window, "_icon_photo", None)
+    if photo is None:
+        # PhotoImage is bound to its Tk interpreter, so cache it per window
+        try:
+            photo = tk.PhotoImage(master=window, data=himage)
+        except tk.TclError:
+            # Tk builds without PNG support - only then pay for PIL
+            import base64
+            import io
+            from PIL import Image, ImageTk
+
+            img = Image.open(io.BytesIO(base64.b64decode(himage)))
+            photo = ImageTk.PhotoImage(image=img, master=window)
+        window._icon_photo = photo
+    return photo
+
 
 def setup_window(self):
     """Setup main window with optimized dimensions."""
     self.W, self.H = 1050, 1010
     screen_width = self.winfo_screenwidth()
     screen_height = self.winfo_screenheight()
-    center_x = int(screen_width / 2 - self.W / 2)
-    center_y = int(screen_height / 2 - self.H / 2)
+    center_x = (screen_width - self.W) // 2
+    center_y = (screen_height - self.H) // 2
+    # Windows are resizable by default; only the floor needs setting
     self.geometry(f"{self.W}x{self.H}+{center_x}+{center_y}")
-    self.resizable(True, True)
-    self.minsize(1050, 1010)
-    if DEBUG:
+    self.minsize(self.W, self.H)
+    if __debug__ and DEBUG:
         print("WINDOW SETUP")
 
 
+def setup_styles(self):
+    """Register the named fonts and label styles used across the GUI."""
+    # Keep the Font objects alive - Tk deletes a named font when it is collected
+    existing = set(tkfont.names(self))
+    self._fonts = {
+        name: (
+            tkfont.nametofont(name, root=self)
+            if name in existing
+            else tkfont.Font(
+                root=self, name=name, family=family, size=size, weight=weight
+            )
+        )
+        for name, family, size, weight in _FONT_SPECS
+    }
+
+    self._style = style = ttk.Style()
+    for name, font in _LABEL_STYLES:
+        style.configure(name, font=font)
+    # Build the themed button/checkbutton styles once, before any widget asks
+    for name in _WIDGET_STYLES:
+        style.configure(name)
+    if __debug__ and DEBUG:
+        print("STYLES SETUP")
+
+
 def setup_icon(self):
     """Setup application icon."""
     try:
-        b64_img = io.BytesIO(base64.b64decode(himage))
-        img = Image.open(b64_img, mode="r")
-        photo = ImageTk.PhotoImage(image=img)
-        self.wm_iconphoto(False, photo)
-        if DEBUG:
+        self.wm_iconphoto(False, _get_icon_photo(self))
+        if __debug__ and DEBUG:
             print("ICON SETUP - Success")
     except Exception as e:
-        if DEBUG:
+        if __debug__ and DEBUG:
             print(f"Icon setup error: {e}")
         # Continue without icon - not critical for functionality
         pass
@@ -83,15 +258,25 @@ def setup_icon(self):
 def create_main_gui(self):
     """Create the main GUI with comprehensive layout."""
     setup_window(self)
+    setup_styles(self)
     setup_icon(self)
 
-    # Initialize encoder components
-    self.encoder = FFMPEGEncoder()
-    self.thread_manager = ThreadManager(self)
-    self.ai_analyzer = OpenAIVideoAnalyzer()
+    # Initialize encoder components (self.encoder is created lazily on first use)
+    self._video_filetypes = [
+        (
+            "Video Files",
+            " ".join(f"*{ext}" for ext in FFMPEGEncoder.SUPPORTED_VIDEO_FORMATS),
+        ),
+        ("All Files", "*.*"),
+    ]
     self.settings_manager = SettingsManager()
+    # One saver thread, so saves land in the order they were made
+    self._settings_saver = ThreadPoolExecutor(max_workers=1)
     self.current_video_info = None
     self.selected_files = []
+    self._folder_scan = None  # Token of the folder scan currently streaming in
+    self._probe_warmup = None  # Token of the scan whose files are being probed
+    self._selection_seq = 0  # Bumped per file load so stale results are dropped
     self.encoding_settings = EncodingSettings()
     self._loading_settings = False  # Flag to prevent auto-save during settings loading
 
@@ -107,37 +292,50 @@ def create_main_gui(self):
     self.progress_var = ttk.DoubleVar()
     self.status_var = ttk.StringVar(value="Ready")
     self.current_file_var = ttk.StringVar(value="")
+    # Latest Tk variable values posted by workers, keyed by attribute name
+    self._pending_ui_vars = {}
+    self._ui_vars_lock = threading.Lock()
+    self._save_after_id = None
+
+    # Worker threads post zero-arg callables here; drained on the Tk main loop
+    self._ui_queue = queue.Queue()
+    self.after(_UI_QUEUE_INTERVAL_MS, partial(_drain_ui_queue, self))
 
     # AI Encoding variables - initialize from settings
-    self.ai_encoding_var = ttk.BooleanVar(value=self.app_settings.ai_encoding_enabled)
-    self.openai_api_key_var = ttk.StringVar(value=self.app_settings.openai_api_key)
+    # Read the loaded settings through one local snapshot
+    saved = vars(self.app_settings)
+
+    self.ai_encoding_var = ttk.BooleanVar(value=saved["ai_encoding_enabled"])
+    self.openai_api_key_var = ttk.StringVar(value=saved["openai_api_key"])
     self.notebook = None  # Will store reference to the notebook for tab control
 
     # Video settings variables - initialize from settings
-    self.video_codec_var = ttk.StringVar(value=self.app_settings.video_codec)
-    self.video_bitrate_var = ttk.StringVar(value=self.app_settings.video_bitrate)
-    self.resolution_var = ttk.StringVar(value=self.app_settings.resolution)
-    self.fps_var = ttk.StringVar(value=self.app_settings.fps)
-    self.crf_var = ttk.IntVar(value=self.app_settings.crf)
-    self.preset_var = ttk.StringVar(value=self.app_settings.preset)
+    self.video_codec_var = ttk.StringVar(value=saved["video_codec"])
+    self.video_bitrate_var = ttk.StringVar(value=saved["video_bitrate"])
+    self.resolution_var = ttk.StringVar(value=saved["resolution"])
+    self.fps_var = ttk.StringVar(value=saved["fps"])
+    self.crf_var = ttk.IntVar(value=saved["crf"])
+    self.crf_text_var = ttk.StringVar(value=str(saved["crf"]))
+    self._crf_flush_scheduled = False
+    self.crf_var.trace_add("write", partial(_on_crf_change, self))
+    self.preset_var = ttk.StringVar(value=saved["preset"])
 
     # Audio settings variables - initialize from settings
-    self.audio_codec_var = ttk.StringVar(value=self.app_settings.audio_codec)
-    self.audio_bitrate_var = ttk.StringVar(value=self.app_settings.audio_bitrate)
-    self.audio_sample_rate_var = ttk.StringVar(
-        value=self.app_settings.audio_sample_rate
-    )
-    self.audio_channels_var = ttk.StringVar(value=self.app_settings.audio_channels)
+    self.audio_codec_var = ttk.StringVar(value=saved["audio_codec"])
+    self.audio_bitrate_var = ttk.StringVar(value=saved["audio_bitrate"])
+    self.audio_sample_rate_var = ttk.StringVar(value=saved["audio_sample_rate"])
+    self.audio_channels_var = ttk.StringVar(value=saved["audio_channels"])
 
     # Output settings - initialize from settings
-    self.output_format_var = ttk.StringVar(value=self.app_settings.output_format)
-    self.output_dir_var = ttk.StringVar(value=self.app_settings.output_directory)
-    self.maintain_structure_var = ttk.BooleanVar(
-        value=self.app_settings.maintain_structure
-    )
+    self.output_format_var = ttk.StringVar(value=saved["output_format"])
+    self.output_dir_var = ttk.StringVar(value=saved["output_directory"])
+    self.maintain_structure_var = ttk.BooleanVar(value=saved["maintain_structure"])
+    self.copy_matching_var = ttk.BooleanVar(value=saved["copy_matching_streams"])
+    self.parallel_jobs_var = ttk.IntVar(value=saved["parallel_jobs"])
+    self.segment_encode_var = ttk.BooleanVar(value=saved["segment_encode"])
 
     # Processing mode - initialize from settings
-    self.processing_mode = ttk.StringVar(value=self.app_settings.processing_mode)
+    self.processing_mode = ttk.StringVar(value=saved["processing_mode"])
 
     # System information dictionary
     self.system_info_dict = {}
@@ -158,11 +356,11 @@ def create_main_gui(self):
     # Create footer with controls and progress
     create_footer_controls(self)
 
-    # Apply AI toggle state on startup if AI is enabled
+    # Apply AI toggle state after the first paint if AI is enabled
     if self.ai_encoding_var.get():
-        on_ai_toggle_changed(self)
+        self.after_idle(partial(on_ai_toggle_changed, self))
 
-    if DEBUG:
+    if __debug__ and DEBUG:
         print("MAIN GUI CREATED")
 
 
@@ -180,7 +378,7 @@ def create_header(self):
     title_label = ttk.Label(
         title_frame,
         text="HoffUI FFMPEG Encoder",
-        font=("Arial", 16, "bold"),
+        style="Title.TLabel",
     )
     title_label.grid(row=0, column=0, sticky="w")
 
@@ -191,14 +389,14 @@ def create_header(self):
     ttk.Button(
         settings_frame,
         text="Save Settings",
-        command=lambda: save_current_settings(self),
+        command=partial(save_current_settings, self),
         width=12,
     ).pack(side="right", padx=(5, 0))
 
     ttk.Button(
         settings_frame,
         text="Load Settings",
-        command=lambda: load_saved_settings(self),
+        command=partial(load_saved_settings, self),
         width=12,
     ).pack(side="right")
 
@@ -212,8 +410,8 @@ def create_header(self):
         ai_frame,
         text="Enable AI-Optimized Encoding",
         variable=self.ai_encoding_var,
-        command=lambda: on_ai_toggle_changed(self),
-        bootstyle=SUCCESS,
+        command=partial(on_ai_toggle_changed, self),
+        style="success.TCheckbutton",
     )
     ai_check.grid(row=0, column=0, sticky="w", pady=(0, 5))
 
@@ -221,7 +419,7 @@ def create_header(self):
     ai_desc = ttk.Label(
         ai_frame,
         text="Uses AI analysis to optimize encoding settings for smallest file size with maximum quality",
-        font=("Arial", 8),
+        style="Small.TLabel",
         foreground="gray",
     )
     ai_desc.grid(row=0, column=1, columnspan=2, sticky="w", padx=(10, 0), pady=(0, 5))
@@ -243,7 +441,7 @@ def create_header(self):
     ttk.Label(
         api_key_frame,
         text="(Optional - uses rule-based fallback if not provided)",
-        font=("Arial", 8),
+        style="Small.TLabel",
         foreground="gray",
     ).grid(row=0, column=1)
 
@@ -251,7 +449,7 @@ def create_header(self):
     mode_frame = ttk.Frame(header_frame)
     mode_frame.grid(row=2, column=0, columnspan=3, pady=(10, 0))
 
-    ttk.Label(mode_frame, text="Processing Mode:", font=("Arial", 10, "bold")).pack(
+    ttk.Label(mode_frame, text="Processing Mode:", style="Heading.TLabel").pack(
         side="left", padx=(0, 10)
     )
 
@@ -260,7 +458,7 @@ def create_header(self):
         text="Single File",
         variable=self.processing_mode,
         value="single",
-        command=lambda: update_mode_selection(self),
+        command=partial(update_mode_selection, self),
     )
     single_radio.pack(side="left", padx=(0, 20))
 
@@ -269,7 +467,7 @@ def create_header(self):
         text="Folder (Recursive)",
         variable=self.processing_mode,
         value="folder",
-        command=lambda: update_mode_selection(self),
+        command=partial(update_mode_selection, self),
     )
     folder_radio.pack(side="left")
 
@@ -281,13 +479,13 @@ def create_header(self):
     self.browse_btn = ttk.Button(
         selection_frame,
         text="Browse File",
-        command=lambda: browse_file_or_folder(self),
+        command=partial(browse_file_or_folder, self),
     )
     self.browse_btn.grid(row=0, column=0, padx=(0, 10))
 
     self.selected_path_var = ttk.StringVar(value="No file selected")
     path_label = ttk.Label(
-        selection_frame, textvariable=self.selected_path_var, font=("Arial", 9)
+        selection_frame, textvariable=self.selected_path_var, style="Info.TLabel"
     )
     path_label.grid(row=0, column=1, sticky="w")
 
@@ -304,7 +502,7 @@ def create_header(self):
     self.output_entry.grid(row=0, column=0, sticky="ew", padx=(0, 10))
 
     output_browse_btn = ttk.Button(
-        output_frame, text="Browse", command=lambda: browse_output_directory(self)
+        output_frame, text="Browse", command=partial(browse_output_directory, self)
     )
     output_browse_btn.grid(row=0, column=1)
 
@@ -316,30 +514,23 @@ def create_video_info_section(self):
     info_frame.columnconfigure(1, weight=1)
     info_frame.columnconfigure(3, weight=1)
 
-    # Video info labels
-    self.info_labels = {}
-    info_items = [
-        ("Filename:", "filename"),
-        ("Duration:", "duration"),
-        ("Resolution:", "resolution"),
-        ("Aspect Ratio:", "aspect_ratio"),
-        ("Video Codec:", "video_codec"),
-        ("Audio Codec:", "audio_codec"),
-        ("Bitrate:", "bitrate"),
-        ("File Size:", "file_size"),
-    ]
+    # Video info labels - each bound to a StringVar; _info_text caches the shown text
+    self.info_labels = info_labels = {}
+    self._info_vars = info_vars = {}
+    self._info_text = dict.fromkeys((key for _, key, _, _ in _INFO_LAYOUT), "N/A")
 
-    for i, (label_text, key) in enumerate(info_items):
-        row = i // 2
-        col_start = (i % 2) * 2
-
-        ttk.Label(info_frame, text=label_text, font=("Arial", 9, "bold")).grid(
+    make_label = ttk.Label
+    make_var = ttk.StringVar
+    for label_text, key, row, col_start in _INFO_LAYOUT:
+        make_label(info_frame, text=label_text, style="InfoBold.TLabel").grid(
             row=row, column=col_start, sticky="w", padx=(0, 5)
         )
 
-        info_label = ttk.Label(info_frame, text="N/A", font=("Arial", 9))
+        info_vars[key] = info_var = make_var(value="N/A")
+        info_labels[key] = info_label = make_label(
+            info_frame, textvariable=info_var, style="Info.TLabel"
+        )
         info_label.grid(row=row, column=col_start + 1, sticky="w", padx=(0, 20))
-        self.info_labels[key] = info_label
 
 
 def create_main_content_tabs(self):
@@ -347,32 +538,68 @@ def create_main_content_tabs(self):
     self.notebook = ttk.Notebook(self)
     self.notebook.grid(row=2, column=0, sticky="nsew", padx=10, pady=(0, 10))
 
-    # Video Settings Tab
+    # Video Settings Tab - built now so the first paint isn't empty
     video_tab = ttk.Frame(self.notebook)
     self.notebook.add(video_tab, text="Video Settings")
     create_video_settings_tab(self, video_tab)
 
-    # Audio Settings Tab
-    audio_tab = ttk.Frame(self.notebook)
-    self.notebook.add(audio_tab, text="Audio Settings")
-    create_audio_settings_tab(self, audio_tab)
+    # Remaining tabs start as empty frames and are built on first selection
+    self._tab_builders = {}
+    for text, builder in (
+        ("Audio Settings", create_audio_settings_tab),
+        ("Output Settings", create_output_settings_tab),
+        ("Extras", create_extras_tab),  # Resource Analytics
+        ("System", create_system_info_tab),
+    ):
+        tab = ttk.Frame(self.notebook)
+        self.notebook.add(tab, text=text)
+        self._tab_builders[str(tab)] = builder
+    self.notebook.bind("<<NotebookTabChanged>>", partial(_maybe_build_tab, self))
 
-    # Output Settings Tab
-    output_tab = ttk.Frame(self.notebook)
-    self.notebook.add(output_tab, text="Output Settings")
-    create_output_settings_tab(self, output_tab)
+    return self.notebook
 
-    # Extras Tab (Resource Analytics)
-    extras_tab = ttk.Frame(self.notebook)
-    self.notebook.add(extras_tab, text="Extras")
-    create_extras_tab(self, extras_tab)
 
-    # System Information Tab
-    system_tab = ttk.Frame(self.notebook)
-    self.notebook.add(system_tab, text="System")
-    create_system_info_tab(self, system_tab)
+def _lazy_var(self, name, cls, default):
+    """Return the Tk variable stored as ``name``, creating it on first use."""
+    var = getattr(self, name, None)
+    if var is None:
+        var = cls(value=default)
+        setattr(self, name, var)
+    return var
 
-    return self.notebook
+
+def _maybe_build_tab(self, event=None):
+    """Build a deferred notebook tab the first time it is selected."""
+    tab_name = self.notebook.select()
+    builder = self._tab_builders.pop(tab_name, None)
+    if builder is not None:
+        builder(self, self.nametowidget(tab_name))
+
+
+def _on_crf_change(self, *_):
+    """Schedule one CRF label refresh per idle cycle while the slider drags."""
+    if not self._crf_flush_scheduled:
+        self._crf_flush_scheduled = True
+        self.after_idle(partial(_flush_crf_label, self))
+
+
+def _flush_crf_label(self):
+    """Show the current CRF value, skipping the write if it is unchanged."""
+    self._crf_flush_scheduled = False
+    text = str(self.crf_var.get())
+    if text != self.crf_text_var.get():
+        self.crf_text_var.set(text)
+
+
+def _grid_fields(frame, fields):
+    """Grid (label text, field widget) pairs down a settings frame's column."""
+    frame.columnconfigure(0, weight=1)
+    last = len(fields) - 1
+    for i, (label_text, field) in enumerate(fields):
+        ttk.Label(frame, text=label_text, style="InfoBold.TLabel").grid(
+            row=i * 2, column=0, sticky="w", pady=(0, 3)
+        )
+        field.grid(row=i * 2 + 1, column=0, sticky="ew", pady=(0, 8) if i < last else 0)
 
 
 def create_video_settings_tab(self, parent):
@@ -390,40 +617,28 @@ def create_video_settings_tab(self, parent):
     codec_frame = ttk.LabelFrame(main_frame, text="Video Codec", padding=10)
     codec_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 5), pady=(0, 10))
 
-    ttk.Label(codec_frame, text="Codec:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     codec_combo = ttk.Combobox(
         codec_frame,
         textvariable=self.video_codec_var,
-        values=list(self.encoder.VIDEO_CODECS.keys()),
+        values=_VIDEO_CODEC_VALUES,
         state="readonly",
         width=25,
     )
-    codec_combo.pack(fill="x", pady=(0, 8))
 
-    ttk.Label(codec_frame, text="Preset:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     preset_combo = ttk.Combobox(
         codec_frame,
         textvariable=self.preset_var,
-        values=self.encoder.PRESETS,
+        values=_PRESET_VALUES,
         state="readonly",
         width=25,
     )
-    preset_combo.pack(fill="x")
+    _grid_fields(codec_frame, (("Codec:", codec_combo), ("Preset:", preset_combo)))
 
     # Quality Settings (Column 2)
     quality_frame = ttk.LabelFrame(main_frame, text="Quality Settings", padding=10)
     quality_frame.grid(row=0, column=1, sticky="nsew", padx=5, pady=(0, 10))
 
-    ttk.Label(quality_frame, text="CRF (Quality):", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
-
     crf_container = ttk.Frame(quality_frame)
-    crf_container.pack(fill="x", pady=(0, 8))
 
     crf_scale = ttk.Scale(
         crf_container,
@@ -436,52 +651,43 @@ def create_video_settings_tab(self, parent):
     crf_scale.pack(side="left", fill="x", expand=True, padx=(0, 8))
 
     self.crf_label = ttk.Label(
-        crf_container, text="23", width=3, font=("Arial", 9, "bold")
+        crf_container, textvariable=self.crf_text_var, width=3, style="InfoBold.TLabel"
     )
     self.crf_label.pack(side="right")
 
-    crf_scale.configure(
-        command=lambda v: self.crf_label.configure(text=str(int(float(v))))
-    )
-
-    ttk.Label(quality_frame, text="Bitrate:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     bitrate_combo = ttk.Combobox(
         quality_frame,
         textvariable=self.video_bitrate_var,
-        values=["Auto", "1000k", "2000k", "4000k", "8000k", "16000k"],
+        values=_VIDEO_BITRATE_VALUES,
         width=25,
     )
-    bitrate_combo.pack(fill="x")
+    _grid_fields(
+        quality_frame, (("CRF (Quality):", crf_container), ("Bitrate:", bitrate_combo))
+    )
 
     # Resolution Settings (Column 3)
     resolution_frame = ttk.LabelFrame(main_frame, text="Resolution & FPS", padding=10)
     resolution_frame.grid(row=0, column=2, sticky="nsew", padx=(5, 0), pady=(0, 10))
 
-    ttk.Label(resolution_frame, text="Resolution:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     resolution_combo = ttk.Combobox(
         resolution_frame,
         textvariable=self.resolution_var,
-        values=list(self.encoder.RESOLUTIONS.keys()),
+        values=_RESOLUTION_VALUES,
         state="readonly",
         width=25,
     )
-    resolution_combo.pack(fill="x", pady=(0, 8))
 
-    ttk.Label(resolution_frame, text="Frame Rate:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     fps_combo = ttk.Combobox(
         resolution_frame,
         textvariable=self.fps_var,
-        values=["Original", "24", "30", "60"],
+        values=_FPS_VALUES,
         state="readonly",
         width=25,
     )
-    fps_combo.pack(fill="x")
+    _grid_fields(
+        resolution_frame,
+        (("Resolution:", resolution_combo), ("Frame Rate:", fps_combo)),
+    )
 
 
 def create_audio_settings_tab(self, parent):
@@ -498,55 +704,46 @@ def create_audio_settings_tab(self, parent):
     codec_frame = ttk.LabelFrame(main_frame, text="Audio Codec", padding=10)
     codec_frame.grid(row=0, column=0, sticky="nsew", padx=(0, 8), pady=(0, 10))
 
-    ttk.Label(codec_frame, text="Codec:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     audio_codec_combo = ttk.Combobox(
         codec_frame,
         textvariable=self.audio_codec_var,
-        values=list(self.encoder.AUDIO_CODECS.keys()),
+        values=_AUDIO_CODEC_VALUES,
         state="readonly",
         width=30,
     )
-    audio_codec_combo.pack(fill="x", pady=(0, 8))
 
-    ttk.Label(codec_frame, text="Channels:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     channels_combo = ttk.Combobox(
         codec_frame,
         textvariable=self.audio_channels_var,
-        values=["Original", "1", "2"],
+        values=_CHANNEL_VALUES,
         state="readonly",
         width=30,
     )
-    channels_combo.pack(fill="x")
+    _grid_fields(
+        codec_frame, (("Codec:", audio_codec_combo), ("Channels:", channels_combo))
+    )
 
     # Audio Quality Settings (Column 2)
     quality_frame = ttk.LabelFrame(main_frame, text="Quality Settings", padding=10)
     quality_frame.grid(row=0, column=1, sticky="nsew", padx=(8, 0), pady=(0, 10))
 
-    ttk.Label(quality_frame, text="Bitrate:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     audio_bitrate_combo = ttk.Combobox(
         quality_frame,
         textvariable=self.audio_bitrate_var,
-        values=["Auto", "64k", "128k", "192k", "256k", "320k"],
+        values=_AUDIO_BITRATE_VALUES,
         width=30,
     )
-    audio_bitrate_combo.pack(fill="x", pady=(0, 8))
 
-    ttk.Label(quality_frame, text="Sample Rate:", font=("Arial", 9, "bold")).pack(
-        anchor="w", pady=(0, 3)
-    )
     sample_rate_combo = ttk.Combobox(
         quality_frame,
         textvariable=self.audio_sample_rate_var,
-        values=["Original", "22050", "44100", "48000"],
+        values=_SAMPLE_RATE_VALUES,
         width=30,
     )
-    sample_rate_combo.pack(fill="x")
+    _grid_fields(
+        quality_frame,
+        (("Bitrate:", audio_bitrate_combo), ("Sample Rate:", sample_rate_combo)),
+    )
 
 
 def create_output_settings_tab(self, parent):
@@ -562,7 +759,7 @@ def create_output_settings_tab(self, parent):
     format_combo = ttk.Combobox(
         format_frame,
         textvariable=self.output_format_var,
-        values=["mp4", "mkv", "avi", "webm"],
+        values=_OUTPUT_FORMAT_VALUES,
         state="readonly",
         width=40,
     )
@@ -572,7 +769,6 @@ def create_output_settings_tab(self, parent):
     advanced_frame = ttk.LabelFrame(settings_frame, text="Advanced Options", padding=15)
     advanced_frame.pack(fill="x")
 
-    self.maintain_structure_var = ttk.BooleanVar(value=True)
     maintain_check = ttk.Checkbutton(
         advanced_frame,
         text="Maintain folder structure in output",
@@ -580,11 +776,38 @@ def create_output_settings_tab(self, parent):
     )
     maintain_check.pack(anchor="w", pady=(0, 10))
 
-    self.overwrite_var = ttk.BooleanVar(value=False)
     overwrite_check = ttk.Checkbutton(
-        advanced_frame, text="Overwrite existing files", variable=self.overwrite_var
+        advanced_frame,
+        text="Overwrite existing files",
+        variable=_lazy_var(self, "overwrite_var", ttk.BooleanVar, False),
     )
-    overwrite_check.pack(anchor="w")
+    overwrite_check.pack(anchor="w", pady=(0, 10))
+
+    copy_check = ttk.Checkbutton(
+        advanced_frame,
+        text="Copy files already in the target codecs (no re-encode)",
+        variable=self.copy_matching_var,
+    )
+    copy_check.pack(anchor="w", pady=(0, 10))
+
+    segment_check = ttk.Checkbutton(
+        advanced_frame,
+        text="Split long files into parallel segments (software codecs)",
+        variable=self.segment_encode_var,
+    )
+    segment_check.pack(anchor="w", pady=(0, 10))
+
+    jobs_frame = ttk.Frame(advanced_frame)
+    jobs_frame.pack(anchor="w")
+    ttk.Label(jobs_frame, text="Parallel encodes (software codecs):").pack(side="left")
+    ttk.Spinbox(
+        jobs_frame,
+        textvariable=self.parallel_jobs_var,
+        from_=1,
+        to=os.cpu_count() or 1,
+        state="readonly",
+        width=5,
+    ).pack(side="left", padx=(10, 0))
 
 
 def create_extras_tab(self, parent):
@@ -604,7 +827,7 @@ def create_extras_tab(self, parent):
     title_frame.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 10))
 
     title_label = ttk.Label(
-        title_frame, text="🚀 Extra Features & Analytics", font=("Arial", 14, "bold")
+        title_frame, text="🚀 Extra Features & Analytics", style="Section.TLabel"
     )
     title_label.pack()
 
@@ -630,7 +853,7 @@ def create_extras_tab(self, parent):
     desc_label = ttk.Label(
         analytics_frame,
         text="Monitor system resources and FFmpeg processes\nin real-time with graphical displays.",
-        font=("Arial", 10),
+        style="Body.TLabel",
         foreground="gray",
         justify="center",
     )
@@ -648,14 +871,14 @@ def create_extras_tab(self, parent):
         toggle_frame,
         text="Enable Resource Analytics",
         variable=self.resource_analytics_enabled,
-        command=lambda: toggle_resource_analytics(self),
+        command=partial(toggle_resource_analytics, self),
         style="success.TCheckbutton",
     )
     analytics_check.pack(side="left")
 
     # Status indicator
     self.analytics_status_label = ttk.Label(
-        toggle_frame, text="● Disabled", font=("Arial", 9), foreground="red"
+        toggle_frame, text="● Disabled", style="Info.TLabel", foreground="red"
     )
     self.analytics_status_label.pack(side="right")
 
@@ -669,7 +892,7 @@ def create_extras_tab(self, parent):
     features_label = ttk.Label(
         analytics_frame,
         text=features_text,
-        font=("Arial", 9),
+        style="Info.TLabel",
         justify="left",
         foreground="gray",
     )
@@ -691,7 +914,7 @@ def create_extras_tab(self, parent):
     future_label = ttk.Label(
         future_frame,
         text=future_text,
-        font=("Arial", 9),
+        style="Info.TLabel",
         justify="left",
         foreground="gray",
     )
@@ -701,7 +924,7 @@ def create_extras_tab(self, parent):
     info_label = ttk.Label(
         future_frame,
         text="\nThese features are planned for future releases.\nStay tuned for updates!",
-        font=("Arial", 8),
+        style="Small.TLabel",
         justify="center",
         foreground="darkgray",
     )
@@ -734,14 +957,14 @@ def create_system_info_tab(self, parent):
     title_label = ttk.Label(
         top_frame,
         text="🖥️ System Detection & Performance Analysis",
-        font=("Arial", 14, "bold"),
+        style="Section.TLabel",
     )
     title_label.grid(row=0, column=0, sticky="w")
 
     self.detect_button = ttk.Button(
         top_frame,
         text="🔍 Detect System Capabilities",
-        command=lambda: detect_system_info_handler(self),
+        command=partial(detect_system_info_handler, self),
         style="Accent.TButton",
         width=25,
     )
@@ -754,7 +977,7 @@ def create_system_info_tab(self, parent):
     status_label = ttk.Label(
         top_frame,
         textvariable=self.detection_status_var,
-        font=("Arial", 9),
+        style="Info.TLabel",
         foreground="blue",
         wraplength=900,
     )
@@ -765,335 +988,317 @@ def create_system_info_tab(self, parent):
     # Left Column - CPU & Memory
     left_column = ttk.Frame(main_frame)
     left_column.grid(row=1, column=0, sticky="nsew", padx=(0, 3))
-    left_column.rowconfigure(0, weight=1)
-    left_column.rowconfigure(1, weight=1)
 
     # Middle Column - GPU & Hardware Acceleration
     middle_column = ttk.Frame(main_frame)
     middle_column.grid(row=1, column=1, sticky="nsew", padx=3)
-    middle_column.rowconfigure(0, weight=1)
-    middle_column.rowconfigure(1, weight=1)
 
     # Right Column - Performance & Settings
     right_column = ttk.Frame(main_frame)
     right_column.grid(row=1, column=2, sticky="nsew", padx=(3, 0))
-    right_column.rowconfigure(0, weight=1)
-    right_column.rowconfigure(1, weight=1)
 
-    # Store references for later use
-    self.system_left_column = left_column
-    self.system_middle_column = middle_column
-    self.system_right_column = right_column
+    # Store references for later use; content goes into per-column inner frames
+    self._system_columns = (left_column, middle_column, right_column)
 
-    # Initial empty state
-    create_compact_empty_display_handler(self)
+    # Show results detected before the tab was first opened, else the empty state
+    if self.system_info_dict:
+        create_system_display_handler(self)
+    else:
+        create_compact_empty_display_handler(self)
+
+
+def _reset_system_columns(self):
+    """Swap in fresh inner frames for the system tab's three columns."""
+    inner_frames = []
+    for column in self._system_columns:
+        # Destroying the single wrapper frame removes all of its children at once
+        for old_inner in column.winfo_children():
+            old_inner.destroy()
+        inner = ttk.Frame(column)
+        inner.pack(fill="both", expand=True)
+        inner.rowconfigure(0, weight=1)
+        inner.rowconfigure(1, weight=1)
+        inner_frames.append(inner)
+    (
+        self.system_left_column,
+        self.system_middle_column,
+        self.system_right_column,
+    ) = inner_frames
 
 
 def create_compact_empty_display_handler(self):
     """Create empty system display for compact three-column layout."""
     # Clear existing content
-    for col in [
+    _reset_system_columns(self)
+
+    columns = (
         self.system_left_column,
         self.system_middle_column,
         self.system_right_column,
-    ]:
-        for widget in col.winfo_children():
-            widget.destroy()
-
-    # Left Column - CPU & Memory section
-    cpu_frame = ttk.LabelFrame(
-        self.system_left_column, text="🖥️ CPU & Memory", padding=8
-    )
-    cpu_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
-
-    cpu_label = ttk.Label(
-        cpu_frame,
-        text="No system detection performed",
-        font=("Arial", 9),
-        foreground="gray",
-    )
-    cpu_label.pack()
-
-    # Memory section in left column
-    mem_frame = ttk.LabelFrame(
-        self.system_left_column, text="🧠 System Memory", padding=8
     )
-    mem_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
-
-    mem_label = ttk.Label(
-        mem_frame,
-        text="Memory info will appear here",
-        font=("Arial", 9),
-        foreground="gray",
-    )
-    mem_label.pack()
-
-    # Middle Column - GPU & Hardware
-    gpu_frame = ttk.LabelFrame(
-        self.system_middle_column, text="🎮 GPU & Graphics", padding=8
-    )
-    gpu_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
-
-    gpu_label = ttk.Label(
-        gpu_frame, text="GPU detection pending", font=("Arial", 9), foreground="gray"
-    )
-    gpu_label.pack()
-
-    # Hardware acceleration section
-    hw_frame = ttk.LabelFrame(
-        self.system_middle_column, text="⚡ Hardware Acceleration", padding=8
-    )
-    hw_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
-
-    hw_label = ttk.Label(
-        hw_frame,
-        text="Acceleration support will be shown here",
-        font=("Arial", 9),
-        foreground="gray",
-    )
-    hw_label.pack()
-
-    # Right Column - Performance & Settings
-    perf_frame = ttk.LabelFrame(
-        self.system_right_column, text="⚡ Performance Settings", padding=8
-    )
-    perf_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
-
-    perf_label = ttk.Label(
-        perf_frame,
-        text="Optimal settings will appear here",
-        font=("Arial", 9),
-        foreground="gray",
-    )
-    perf_label.pack()
-
-    # Summary section in right column
-    summary_frame = ttk.LabelFrame(
-        self.system_right_column, text="📊 Quick Summary", padding=8
-    )
-    summary_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
-
-    summary_label = ttk.Label(
-        summary_frame,
-        text="Click 'Detect System Capabilities' to begin",
-        font=("Arial", 9),
-        foreground="gray",
-    )
-    summary_label.pack()
+    for col, row, title, text in _EMPTY_SYSTEM_SECTIONS:
+        section = ttk.LabelFrame(columns[col], text=title, padding=8)
+        section.grid(
+            row=row, column=0, sticky="nsew", pady=(0, 4) if row == 0 else (4, 0)
+        )
+        ttk.Label(section, text=text, style="Info.TLabel", foreground="gray").pack()
+
+
+def build_system_info_dict(system_specs, optimal_settings):
+    """Flatten detection results into the dict the System tab renders."""
+    cpu_brand = system_specs.cpu_brand
+    hw_accel_joined = ", ".join(system_specs.hw_acceleration)
+    return {
+        "cpu_physical_cores": system_specs.cpu_cores_physical,
+        "cpu_logical_cores": system_specs.cpu_cores_logical,
+        "cpu_brand": cpu_brand,
+        "memory_total_gb": system_specs.memory_total_gb,
+        "memory_available_gb": system_specs.memory_available_gb,
+        "gpu_info": system_specs.gpu_info,
+        "hw_acceleration": system_specs.hw_acceleration,
+        "ffmpeg_encoders": system_specs.ffmpeg_encoders,
+        "optimal_threads": optimal_settings.optimal_threads,
+        "conservative_threads": optimal_settings.conservative_threads,
+        "preferred_hwaccel": optimal_settings.preferred_hwaccel,
+        "buffer_size": optimal_settings.buffer_size,
+        "mux_queue_size": optimal_settings.mux_queue_size,
+        "reasoning": optimal_settings.reasoning,
+        # Display strings, truncated once here instead of on every redraw
+        "cpu_brand_display": (
+            cpu_brand[:30] + "..." if len(cpu_brand) > 30 else cpu_brand
+        ),
+        "gpu_display_list": [
+            gpu[:35] + "..." if len(gpu) > 35 else gpu for gpu in system_specs.gpu_info
+        ],
+        "hw_accel_joined": hw_accel_joined,
+        "hw_accel_display": (
+            hw_accel_joined[:40] + "..."
+            if len(hw_accel_joined) > 40
+            else hw_accel_joined
+        ),
+    }
 
 
 def detect_system_info_handler(self):
     """Detect and display system information."""
-    try:
-        self.detection_status_var.set("🔍 Detecting system capabilities...")
-        self.detect_button.config(state="disabled")
-        self.update()
-
-        # Get system specs and optimal settings
-        system_specs, optimal_settings = self.encoder.get_system_info()
+    self.detection_status_var.set("🔍 Detecting system capabilities...")
+    self.detect_button.config(state="disabled")
 
+    def on_detected(result):
+        system_specs, optimal_settings = result
         if system_specs and optimal_settings:
             # Populate system info dictionary
-            self.system_info_dict = {
-                "cpu_physical_cores": system_specs.cpu_cores_physical,
-                "cpu_logical_cores": system_specs.cpu_cores_logical,
-                "cpu_brand": system_specs.cpu_brand,
-                "memory_total_gb": system_specs.memory_total_gb,
-                "memory_available_gb": system_specs.memory_available_gb,
-                "gpu_info": system_specs.gpu_info,
-                "hw_acceleration": system_specs.hw_acceleration,
-                "ffmpeg_encoders": system_specs.ffmpeg_encoders,
-                "optimal_threads": optimal_settings.optimal_threads,
-                "conservative_threads": optimal_settings.conservative_threads,
-                "preferred_hwaccel": optimal_settings.preferred_hwaccel,
-                "buffer_size": optimal_settings.buffer_size,
-                "mux_queue_size": optimal_settings.mux_queue_size,
-                "reasoning": optimal_settings.reasoning,
-            }
+            self.system_info_dict = build_system_info_dict(
+                system_specs, optimal_settings
+            )
 
             self.detection_status_var.set("✅ System detection completed successfully!")
             create_system_display_handler(self)
         else:
             self.detection_status_var.set("❌ System detection failed")
+        self.detect_button.config(state="normal")
 
-    except Exception as e:
+    def on_error(e):
         self.detection_status_var.set(f"❌ Error during detection: {str(e)}")
-        if DEBUG:
+        if __debug__ and DEBUG:
             print(f"System detection error: {e}")
-    finally:
         self.detect_button.config(state="normal")
 
+    # Hardware probing shells out to lscpu/ffmpeg - keep it off the Tk thread
+    self.thread_manager.run_with_progress(
+        target_func=lambda: self.encoder.get_system_info(),
+        completion_callback=on_detected,
+        error_callback=on_error,
+    )
+
+
+def _make_info_tree(parent, rows, key_width):
+    """Create a two-column key/value Treeview holding the given rows."""
+    tree = ttk.Treeview(
+        parent,
+        columns=("value",),
+        show="tree",
+        height=len(rows),
+        selectmode="none",
+    )
+    tree.column("#0", width=key_width, stretch=False, anchor="w")
+    tree.column("value", anchor="w", stretch=True)
+    tree.tag_configure("good", foreground="green")
+    for iid, label, value, tags in rows:
+        tree.insert("", "end", iid=iid, text=label, values=(value,), tags=tags)
+    tree.pack(fill="both", expand=True)
+    return tree
+
 
 def create_system_display_handler(self):
     """Create compact system information display for three-column layout."""
-    # Clear existing content
-    for col in [
-        self.system_left_column,
-        self.system_middle_column,
-        self.system_right_column,
-    ]:
-        for widget in col.winfo_children():
-            widget.destroy()
-
-    # LEFT COLUMN - CPU & Memory Information
-    cpu_frame = ttk.LabelFrame(
-        self.system_left_column, text="💻 CPU Information", padding=6
-    )
-    cpu_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
+    # System tab not built yet - it renders system_info_dict when first opened
+    if not hasattr(self, "_system_columns"):
+        return
 
-    cpu_info = [
-        ("Physical Cores:", f"{self.system_info_dict['cpu_physical_cores']}"),
-        ("Logical Cores:", f"{self.system_info_dict['cpu_logical_cores']}"),
-        (
-            "CPU Model:",
+    # Nothing to redraw if these results are already on screen
+    d = self.system_info_dict
+    if d == getattr(self, "_rendered_system_info", None):
+        return
+    # Copy, since start_encoding refreshes system_info_dict in place
+    self._rendered_system_info = dict(d)
+
+    # Bind the detection results and derived figures once
+    memory_total = d["memory_total_gb"]
+    memory_available = d["memory_available_gb"]
+    usage_pct = (
+        (memory_total - memory_available) / memory_total * 100.0
+        if memory_total
+        else 0.0
+    )
+    optimal_threads = d["optimal_threads"]
+    speed_improvement = optimal_threads * 0.25  # relative to the old 4-thread default
+    preferred_hwaccel = d["preferred_hwaccel"]
+    hw_acceleration = d["hw_accel_joined"]
+
+    # Key/value sections: (row id, label, value, tags)
+    good = ("good",)
+    sections = {
+        "cpu": (
+            ("physical_cores", "Physical Cores:", d["cpu_physical_cores"], ()),
+            ("logical_cores", "Logical Cores:", d["cpu_logical_cores"], ()),
+            ("cpu_model", "CPU Model:", d["cpu_brand_display"], ()),
+        ),
+        "memory": (
+            ("total", "Total Memory:", f"{memory_total:.1f} GB", ()),
+            ("available", "Available:", f"{memory_available:.1f} GB", ()),
+            ("usage", "Usage:", f"{usage_pct:.1f}%", ()),
+        ),
+        "settings": (
+            ("optimal", "Optimal Threads:", optimal_threads, good),
+            ("conservative", "Conservative:", d["conservative_threads"], good),
+            ("buffer", "Buffer Size:", d["buffer_size"], good),
+            ("mux_queue", "Mux Queue:", d["mux_queue_size"], good),
+        ),
+        "perf": (
+            ("previous", "Previous:", "4 threads", ()),
+            ("new", "New:", f"{optimal_threads} threads", ()),
+            ("speed", "Speed Gain:", f"{speed_improvement:.1f}x faster", good),
             (
-                self.system_info_dict["cpu_brand"][:30] + "..."
-                if len(self.system_info_dict["cpu_brand"]) > 30
-                else self.system_info_dict["cpu_brand"]
+                "hw_boost",
+                "HW Boost:",
+                "Yes" if preferred_hwaccel else "No",
+                good if preferred_hwaccel else (),
             ),
         ),
-    ]
+    }
 
-    for label, value in cpu_info:
-        row_frame = ttk.Frame(cpu_frame)
-        row_frame.pack(fill="x", pady=1)
-        ttk.Label(row_frame, text=label, font=("Arial", 9, "bold"), width=12).pack(
-            side="left", anchor="w"
+    trees = getattr(self, "_system_trees", None)
+    if trees is None:
+        # First detection - build the section frames and trees once
+        _reset_system_columns(self)
+
+        cpu_frame = ttk.LabelFrame(
+            self.system_left_column, text="💻 CPU Information", padding=6
         )
-        ttk.Label(row_frame, text=value, font=("Arial", 9)).pack(
-            side="left", padx=(5, 0)
+        cpu_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
+        memory_frame = ttk.LabelFrame(
+            self.system_left_column, text="🧠 Memory Information", padding=6
         )
+        memory_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
 
-    # Memory section in left column
-    memory_frame = ttk.LabelFrame(
-        self.system_left_column, text="🧠 Memory Information", padding=6
-    )
-    memory_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
-
-    memory_info = [
-        ("Total Memory:", f"{self.system_info_dict['memory_total_gb']:.1f} GB"),
-        ("Available:", f"{self.system_info_dict['memory_available_gb']:.1f} GB"),
-        (
-            "Usage:",
-            f"{((self.system_info_dict['memory_total_gb'] - self.system_info_dict['memory_available_gb']) / self.system_info_dict['memory_total_gb'] * 100):.1f}%",
-        ),
-    ]
-
-    for label, value in memory_info:
-        row_frame = ttk.Frame(memory_frame)
-        row_frame.pack(fill="x", pady=1)
-        ttk.Label(row_frame, text=label, font=("Arial", 9, "bold"), width=12).pack(
-            side="left", anchor="w"
+        self._gpu_frame = ttk.LabelFrame(
+            self.system_middle_column, text="🎮 GPU Information", padding=6
         )
-        ttk.Label(row_frame, text=value, font=("Arial", 9)).pack(
-            side="left", padx=(5, 0)
+        self._gpu_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
+        self._hwaccel_frame = ttk.LabelFrame(
+            self.system_middle_column, text="⚡ Hardware Acceleration", padding=6
         )
+        self._hwaccel_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
 
-    # MIDDLE COLUMN - GPU & Hardware Acceleration
-    gpu_frame = ttk.LabelFrame(
-        self.system_middle_column, text="🎮 GPU Information", padding=6
-    )
-    gpu_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
-
-    if self.system_info_dict["gpu_info"]:
-        for i, gpu in enumerate(self.system_info_dict["gpu_info"]):
-            gpu_short = gpu[:35] + "..." if len(gpu) > 35 else gpu
-            ttk.Label(gpu_frame, text=f"GPU {i + 1}:", font=("Arial", 9, "bold")).pack(
+        settings_frame = ttk.LabelFrame(
+            self.system_right_column, text="⚡ Optimal Settings", padding=6
+        )
+        settings_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
+        perf_frame = ttk.LabelFrame(
+            self.system_right_column, text="📊 Performance Analysis", padding=6
+        )
+        perf_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
+
+        self._system_trees = {
+            "cpu": _make_info_tree(cpu_frame, sections["cpu"], 100),
+            "memory": _make_info_tree(memory_frame, sections["memory"], 100),
+            "settings": _make_info_tree(settings_frame, sections["settings"], 110),
+            "perf": _make_info_tree(perf_frame, sections["perf"], 110),
+        }
+    else:
+        # Refresh - rewrite the existing rows in place
+        for name, rows in sections.items():
+            tree = trees[name]
+            for iid, _, value, tags in rows:
+                tree.item(iid, values=(value,), tags=tags)
+        for frame in (self._gpu_frame, self._hwaccel_frame):
+            for child in frame.winfo_children():
+                child.destroy()
+
+    # MIDDLE COLUMN - GPU list and acceleration vary in length, so use labels
+    gpu_frame = self._gpu_frame
+    gpu_list = d["gpu_display_list"]
+    if gpu_list:
+        for i, gpu_short in enumerate(gpu_list[:_MAX_GPUS_SHOWN]):
+            ttk.Label(gpu_frame, text=f"GPU {i + 1}:", style="InfoBold.TLabel").pack(
                 anchor="w"
             )
-            ttk.Label(gpu_frame, text=gpu_short, font=("Arial", 8)).pack(
+            ttk.Label(gpu_frame, text=gpu_short, style="Small.TLabel").pack(
                 anchor="w", padx=(10, 0)
             )
+        hidden = len(gpu_list) - _MAX_GPUS_SHOWN
+        if hidden > 0:
+            more_label = ttk.Label(
+                gpu_frame,
+                text=f"+{hidden} more",
+                style="Small.TLabel",
+                foreground="blue",
+                cursor="hand2",
+            )
+            more_label.pack(anchor="w", pady=(3, 0))
+            more_label.bind(
+                "<Button-1>", lambda e, gpus=d["gpu_info"]: _show_all_gpus(gpus)
+            )
     else:
         ttk.Label(
-            gpu_frame, text="No GPU detected", font=("Arial", 9), foreground="orange"
+            gpu_frame, text="No GPU detected", style="Info.TLabel", foreground="orange"
         ).pack(anchor="w")
 
-    # Hardware acceleration in middle column
-    hwaccel_frame = ttk.LabelFrame(
-        self.system_middle_column, text="⚡ Hardware Acceleration", padding=6
-    )
-    hwaccel_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
-
-    if self.system_info_dict["hw_acceleration"]:
-        ttk.Label(hwaccel_frame, text="Available:", font=("Arial", 9, "bold")).pack(
+    hwaccel_frame = self._hwaccel_frame
+    if hw_acceleration:
+        ttk.Label(hwaccel_frame, text="Available:", style="InfoBold.TLabel").pack(
             anchor="w"
         )
-        hwaccel_text = (
-            ", ".join(self.system_info_dict["hw_acceleration"])[:40] + "..."
-            if len(", ".join(self.system_info_dict["hw_acceleration"])) > 40
-            else ", ".join(self.system_info_dict["hw_acceleration"])
-        )
-        ttk.Label(hwaccel_frame, text=hwaccel_text, font=("Arial", 8)).pack(
+        ttk.Label(hwaccel_frame, text=d["hw_accel_display"], style="Small.TLabel").pack(
             anchor="w", padx=(10, 0)
         )
 
-        if self.system_info_dict["preferred_hwaccel"]:
-            ttk.Label(hwaccel_frame, text="Preferred:", font=("Arial", 9, "bold")).pack(
+        if preferred_hwaccel:
+            ttk.Label(hwaccel_frame, text="Preferred:", style="InfoBold.TLabel").pack(
                 anchor="w", pady=(3, 0)
             )
             ttk.Label(
                 hwaccel_frame,
-                text=self.system_info_dict["preferred_hwaccel"],
-                font=("Arial", 9),
+                text=preferred_hwaccel,
+                style="Info.TLabel",
                 foreground="green",
             ).pack(anchor="w", padx=(10, 0))
     else:
         ttk.Label(
             hwaccel_frame,
             text="Software encoding only",
-            font=("Arial", 9),
+            style="Info.TLabel",
             foreground="orange",
         ).pack(anchor="w")
 
-    # RIGHT COLUMN - Performance & Settings
-    settings_frame = ttk.LabelFrame(
-        self.system_right_column, text="⚡ Optimal Settings", padding=6
-    )
-    settings_frame.grid(row=0, column=0, sticky="nsew", pady=(0, 4))
-
-    settings_info = [
-        ("Optimal Threads:", f"{self.system_info_dict['optimal_threads']}"),
-        ("Conservative:", f"{self.system_info_dict['conservative_threads']}"),
-        ("Buffer Size:", self.system_info_dict["buffer_size"]),
-        ("Mux Queue:", str(self.system_info_dict["mux_queue_size"])),
-    ]
 
-    for label, value in settings_info:
-        row_frame = ttk.Frame(settings_frame)
-        row_frame.pack(fill="x", pady=1)
-        ttk.Label(row_frame, text=label, font=("Arial", 9, "bold"), width=11).pack(
-            side="left", anchor="w"
-        )
-        ttk.Label(row_frame, text=value, font=("Arial", 9), foreground="green").pack(
-            side="left", padx=(5, 0)
-        )
-
-    # Performance estimate in right column
-    perf_frame = ttk.LabelFrame(
-        self.system_right_column, text="📊 Performance Analysis", padding=6
+def _show_all_gpus(gpus):
+    """Show the full, untruncated GPU list."""
+    messagebox.showinfo(
+        "GPU Information",
+        "\n".join(f"GPU {i + 1}: {gpu}" for i, gpu in enumerate(gpus)),
     )
-    perf_frame.grid(row=1, column=0, sticky="nsew", pady=(4, 0))
-
-    speed_improvement = self.system_info_dict["optimal_threads"] / 4
-
-    perf_info = [
-        ("Previous:", "4 threads"),
-        ("New:", f"{self.system_info_dict['optimal_threads']} threads"),
-        ("Speed Gain:", f"{speed_improvement:.1f}x faster"),
-        ("HW Boost:", "Yes" if self.system_info_dict["preferred_hwaccel"] else "No"),
-    ]
-
-    for label, value in perf_info:
-        row_frame = ttk.Frame(perf_frame)
-        row_frame.pack(fill="x", pady=1)
-        ttk.Label(row_frame, text=label, font=("Arial", 9, "bold"), width=11).pack(
-            side="left", anchor="w"
-        )
-        color = "green" if "faster" in value or value == "Yes" else "black"
-        ttk.Label(row_frame, text=value, font=("Arial", 9), foreground=color).pack(
-            side="left", padx=(5, 0)
-        )
 
 
 def create_footer_controls(self):
@@ -1117,7 +1322,7 @@ def create_footer_controls(self):
     current_file_label = ttk.Label(
         progress_frame,
         textvariable=self.current_file_var,
-        font=("Arial", 9),
+        style="Info.TLabel",
         foreground="blue",
     )
     current_file_label.grid(row=1, column=0, sticky="w", pady=(0, 2))
@@ -1133,21 +1338,21 @@ def create_footer_controls(self):
     self.start_btn = ttk.Button(
         button_frame,
         text="Start Encoding",
-        bootstyle=SUCCESS,
-        command=lambda: start_encoding(self),
+        style="success.TButton",
+        command=partial(start_encoding, self),
     )
     self.start_btn.pack(side="left", padx=(0, 10))
 
     self.stop_btn = ttk.Button(
         button_frame,
         text="Stop",
-        bootstyle=WARNING,
-        command=lambda: stop_encoding(self),
+        style="warning.TButton",
+        command=partial(stop_encoding, self),
         state=DISABLED,
     )
     self.stop_btn.pack(side="left", padx=(0, 10))
 
-    ttk.Button(button_frame, text="Clear", command=lambda: clear_all(self)).pack(
+    ttk.Button(button_frame, text="Clear", command=partial(clear_all, self)).pack(
         side="left"
     )
 
@@ -1158,41 +1363,55 @@ def save_current_settings(self):
     """Save current GUI settings to file."""
     try:
         # Update app_settings from current GUI state
-        self.app_settings.openai_api_key = self.openai_api_key_var.get()
-        self.app_settings.ai_encoding_enabled = self.ai_encoding_var.get()
-
+        fields = _AI_SETTINGS_FIELDS + _OUTPUT_SETTINGS_FIELDS
         # Only save manual settings if AI is not enabled
         if not self.ai_encoding_var.get():
-            self.app_settings.video_codec = self.video_codec_var.get()
-            self.app_settings.video_bitrate = self.video_bitrate_var.get()
-            self.app_settings.resolution = self.resolution_var.get()
-            self.app_settings.fps = self.fps_var.get()
-            self.app_settings.crf = self.crf_var.get()
-            self.app_settings.preset = self.preset_var.get()
-
-            self.app_settings.audio_codec = self.audio_codec_var.get()
-            self.app_settings.audio_bitrate = self.audio_bitrate_var.get()
-            self.app_settings.audio_sample_rate = self.audio_sample_rate_var.get()
-            self.app_settings.audio_channels = self.audio_channels_var.get()
-
-        self.app_settings.output_format = self.output_format_var.get()
-        self.app_settings.output_directory = self.output_dir_var.get()
-        self.app_settings.maintain_structure = self.maintain_structure_var.get()
-        self.app_settings.processing_mode = self.processing_mode.get()
-
-        # Save to file
-        if self.settings_manager.save_settings(self.app_settings):
-            self.status_var.set("Settings saved successfully!")
-            show_toast("Success", "Settings saved to configuration file!")
-        else:
-            self.status_var.set("Failed to save settings")
-            show_toast("Error", "Failed to save settings")
+            fields += _MANUAL_SETTINGS_FIELDS
+        for var_attr, settings_attr in fields:
+            setattr(self.app_settings, settings_attr, getattr(self, var_attr).get())
+
+        # Save a snapshot to file off the Tk thread; queued behind any earlier
+        # save so the newest snapshot is always the one left on disk
+        snapshot = replace(self.app_settings)
+        future = self._settings_saver.submit(
+            self.settings_manager.save_settings, snapshot
+        )
+        future.add_done_callback(
+            lambda done: self._ui_queue.put(
+                partial(_on_settings_saved, self, done.result())
+            )
+        )
 
     except Exception as e:
         self.status_var.set(f"Error saving settings: {str(e)}")
         print(f"Settings save error: {e}")
 
 
+def schedule_settings_save(self):
+    """Auto-save settings once rapid changes have settled."""
+    if self._save_after_id is not None:
+        self.after_cancel(self._save_after_id)
+    self._save_after_id = self.after(
+        _AUTOSAVE_DELAY_MS, partial(_run_settings_save, self)
+    )
+
+
+def _run_settings_save(self):
+    """Run the debounced settings save."""
+    self._save_after_id = None
+    save_current_settings(self)
+
+
+def _on_settings_saved(self, saved):
+    """Report the result of a background settings save."""
+    if saved:
+        self.status_var.set("Settings saved successfully!")
+        show_toast("Success", "Settings saved to configuration file!")
+    else:
+        self.status_var.set("Failed to save settings")
+        show_toast("Error", "Failed to save settings")
+
+
 def load_saved_settings(self):
     """Load settings from file and apply to GUI."""
     try:
@@ -1208,35 +1427,16 @@ def load_saved_settings(self):
         self.app_settings = self.settings_manager.load_settings()
 
         # Apply to GUI variables
-        self.openai_api_key_var.set(self.app_settings.openai_api_key)
-        self.ai_encoding_var.set(self.app_settings.ai_encoding_enabled)
-
+        fields = _AI_SETTINGS_FIELDS + _OUTPUT_SETTINGS_FIELDS
         # Only load manual settings if AI is not enabled in saved settings
         if not self.app_settings.ai_encoding_enabled:
-            self.video_codec_var.set(self.app_settings.video_codec)
-            self.video_bitrate_var.set(self.app_settings.video_bitrate)
-            self.resolution_var.set(self.app_settings.resolution)
-            self.fps_var.set(self.app_settings.fps)
-            self.crf_var.set(self.app_settings.crf)
-            self.preset_var.set(self.app_settings.preset)
-
-            self.audio_codec_var.set(self.app_settings.audio_codec)
-            self.audio_bitrate_var.set(self.app_settings.audio_bitrate)
-            self.audio_sample_rate_var.set(self.app_settings.audio_sample_rate)
-            self.audio_channels_var.set(self.app_settings.audio_channels)
-
-        self.output_format_var.set(self.app_settings.output_format)
-        self.output_dir_var.set(self.app_settings.output_directory)
-        self.maintain_structure_var.set(self.app_settings.maintain_structure)
-        self.processing_mode.set(self.app_settings.processing_mode)
+            fields += _MANUAL_SETTINGS_FIELDS
+        for var_attr, settings_attr in fields:
+            getattr(self, var_attr).set(getattr(self.app_settings, settings_attr))
 
         # Update mode selection UI
         update_mode_selection(self)
 
-        # Update CRF label if it exists
-        if hasattr(self, "crf_label"):
-            self.crf_label.configure(text=str(self.crf_var.get()))
-
         # Clear loading flag before triggering AI toggle
         self._loading_settings = False
 
@@ -1283,7 +1483,7 @@ def on_ai_toggle_changed(self):
     if hasattr(self, "_loading_settings") and self._loading_settings:
         return
     if hasattr(self, "settings_manager"):
-        save_current_settings(self)
+        schedule_settings_save(self)
 
 
 def update_ai_encoding_settings(self, file_path):
@@ -1291,13 +1491,14 @@ def update_ai_encoding_settings(self, file_path):
     if not self.ai_encoding_var.get() or not self.current_video_info:
         return
 
-    try:
-        self.status_var.set("AI analyzing video for optimal settings...")
+    seq = self._selection_seq
+    self.status_var.set("AI analyzing video for optimal settings...")
 
-        # Perform AI analysis
-        analysis, optimized_settings = self.ai_analyzer.analyze_video(
-            file_path, self.current_video_info
-        )
+    def on_analyzed(result):
+        # Drop results for a file that is no longer selected
+        if seq != self._selection_seq:
+            return
+        analysis, optimized_settings = result
 
         # Update encoding settings
         self.encoding_settings = optimized_settings
@@ -1317,10 +1518,20 @@ def update_ai_encoding_settings(self, file_path):
             f"AI Analysis: {complexity_desc} (CRF: {analysis.recommended_crf}, Preset: {analysis.recommended_preset})"
         )
 
-    except Exception as e:
+    def on_error(e):
+        if seq != self._selection_seq:
+            return
         self.status_var.set(f"AI Analysis failed: {str(e)} - using fallback settings")
         print(f"AI Analysis error: {e}")
 
+    # Perform AI analysis off the Tk thread
+    self.thread_manager.run_with_progress(
+        target_func=self.ai_analyzer.analyze_video,
+        completion_callback=on_analyzed,
+        error_callback=on_error,
+        args=(file_path, self.current_video_info),
+    )
+
 
 def create_folder_browser_dialog(title="Select Folder", initial_dir=None):
     """Create a custom folder browser dialog that's larger and easier to use."""
@@ -1367,17 +1578,22 @@ def create_folder_browser_dialog(title="Select Folder", initial_dir=None):
 
     # Populate tree with directories
     def populate_tree(parent, path):
+        # scandir's DirEntry.is_dir() reuses the d_type from the listing, so
+        # non-symlink entries need no extra stat() call
         try:
-            for item in sorted(os.listdir(path)):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    node = tree.insert(
-                        parent, "end", text=item, values=[item_path], open=False
-                    )
-                    # Add dummy child to show expand arrow
-                    tree.insert(node, "end", text="Loading...", values=[])
+            with os.scandir(path) as entries:
+                dirs = sorted(
+                    (entry for entry in entries if entry.is_dir()),
+                    key=lambda entry: entry.name,
+                )
         except PermissionError:
-            pass
+            return
+        for entry in dirs:
+            node = tree.insert(
+                parent, "end", text=entry.name, values=[entry.path], open=False
+            )
+            # Add dummy child to show expand arrow
+            tree.insert(node, "end", text="Loading...", values=[])
 
     def on_tree_expand(event):
         item = tree.focus()
@@ -1423,76 +1639,141 @@ def update_mode_selection(self):
         self.browse_btn.configure(text="Browse Folder")
 
 
+def _show_dialog_async(self, dialog_fn, callback):
+    """Open a modal dialog from the next idle cycle and pass a non-empty result on."""
+
+    def run_dialog():
+        result = dialog_fn()
+        if result:
+            callback(result)
+
+    # Tk dialogs must stay on the main thread; deferring lets the click return and
+    # pending redraws flush before the dialog's nested event loop starts
+    self.after_idle(run_dialog)
+
+
 def browse_file_or_folder(self):
     """Browse for file or folder based on current mode."""
     if self.processing_mode.get() == "single":
-        file_path = filedialog.askopenfilename(
-            title="Select Video File",
-            filetypes=[
-                (
-                    "Video Files",
-                    " ".join(f"*{ext}" for ext in self.encoder.SUPPORTED_VIDEO_FORMATS),
-                ),
-                ("All Files", "*.*"),
-            ],
+        _show_dialog_async(
+            self,
+            partial(
+                filedialog.askopenfilename,
+                title="Select Video File",
+                filetypes=self._video_filetypes,
+            ),
+            partial(on_video_file_selected, self),
         )
-        if file_path:
-            self.selected_path_var.set(file_path)
-            self.selected_files = [file_path]
-            load_video_info(self, file_path)
     else:
         # Use custom folder browser for better user experience
-        folder_path = create_folder_browser_dialog(
-            title="Select Video Folder", initial_dir=os.path.expanduser("~")
+        _show_dialog_async(
+            self,
+            partial(
+                create_folder_browser_dialog,
+                title="Select Video Folder",
+                initial_dir=os.path.expanduser("~"),
+            ),
+            partial(on_video_folder_selected, self),
         )
-        if folder_path:
-            self.selected_path_var.set(folder_path)
-            # Load files in background thread
-            self.thread_manager.run_with_progress(
-                target_func=lambda: self.encoder.find_video_files(
-                    folder_path, recursive=True
-                ),
-                completion_callback=lambda files: on_folder_loaded(self, files),
-                progress_callback=lambda p, s: self.status_var.set(s),
-                args=(),
-            )
+
+
+def on_video_file_selected(self, file_path):
+    """Load the chosen video file."""
+    self.selected_path_var.set(file_path)
+    self._folder_scan = self._probe_warmup = None
+    self.selected_files = [file_path]
+    load_video_info(self, file_path)
+
+
+def on_video_folder_selected(self, folder_path):
+    """Scan the chosen folder for video files in the background."""
+    self.selected_path_var.set(folder_path)
+    self.selected_files = []
+    self.status_var.set("Scanning folder...")
+    # A fresh token lets batches from a superseded scan be ignored
+    self._folder_scan = self._probe_warmup = scan = object()
+    self.thread_manager.run_with_progress(
+        target_func=_scan_folder,
+        args=(self, folder_path, scan),
+    )
+
+
+def _scan_folder(self, folder_path, scan):
+    """Stream found video files to the UI queue in batches (worker thread)."""
+    found = []
+    batch = []
+    for path in self.encoder.iter_video_files(folder_path, recursive=True):
+        found.append(path)
+        batch.append(path)
+        if len(batch) >= _SCAN_BATCH:
+            self._ui_queue.put(partial(on_folder_batch, self, scan, batch))
+            batch = []
+    self._ui_queue.put(partial(on_folder_loaded, self, scan, batch))
+
+    # Warm the video info cache so the first files don't wait on a probe;
+    # cancelled by a new selection, Clear or starting an encode
+    warm = sorted(found)[:_WARM_PROBE_LIMIT]
+    if warm:
+        with ThreadPoolExecutor(max_workers=_WARM_PROBE_WORKERS) as pool:
+            list(pool.map(partial(_warm_video_info, self, scan), warm))
+
+
+def _warm_video_info(self, scan, file_path):
+    """Probe one file ahead of time unless the warm-up has been cancelled."""
+    if scan is self._probe_warmup and not self.thread_manager.stop_requested:
+        self.encoder.get_video_info(file_path)
+
+
+def on_folder_batch(self, scan, files):
+    """Append a batch of discovered files while the scan is running."""
+    if scan is not self._folder_scan:
+        return
+    self.selected_files.extend(files)
+    self.status_var.set(f"Scanning folder... {len(self.selected_files)} found")
 
 
 def browse_output_directory(self):
     """Browse for output directory."""
-    directory = create_folder_browser_dialog(
-        title="Select Output Directory", initial_dir=os.path.expanduser("~")
+    _show_dialog_async(
+        self,
+        partial(
+            create_folder_browser_dialog,
+            title="Select Output Directory",
+            initial_dir=os.path.expanduser("~"),
+        ),
+        self.output_dir_var.set,
     )
-    if directory:
-        self.output_dir_var.set(directory)
 
 
 def load_video_info(self, file_path):
     """Load and display video information."""
+    seq = self._selection_seq = self._selection_seq + 1
 
     def load_info():
         return self.encoder.get_video_info(file_path)
 
     def update_info(video_info):
+        # A newer selection has superseded this one
+        if seq != self._selection_seq:
+            return
         if video_info:
             self.current_video_info = video_info
-            self.info_labels["filename"].configure(text=video_info.filename)
-            self.info_labels["duration"].configure(
-                text=self.encoder.format_duration(video_info.duration)
-            )
-            self.info_labels["resolution"].configure(
-                text=f"{video_info.width}x{video_info.height}"
-            )
-            self.info_labels["aspect_ratio"].configure(text=video_info.aspect_ratio)
-            self.info_labels["video_codec"].configure(text=video_info.video_codec)
-            self.info_labels["audio_codec"].configure(text=video_info.audio_codec)
-            self.info_labels["bitrate"].configure(
-                text=(
-                    f"{video_info.bitrate} bps" if video_info.bitrate > 0 else "Unknown"
-                )
-            )
-            self.info_labels["file_size"].configure(
-                text=self.encoder.format_file_size(video_info.file_size)
+            set_info_fields(
+                self,
+                {
+                    "filename": video_info.filename,
+                    "duration": self.encoder.format_duration(video_info.duration),
+                    "resolution": f"{video_info.width}x{video_info.height}",
+                    "aspect_ratio": video_info.aspect_ratio,
+                    "video_codec": video_info.video_codec,
+                    "audio_codec": video_info.audio_codec,
+                    "bitrate": (
+                        f"{video_info.bitrate} bps"
+                        if video_info.bitrate > 0
+                        else "Unknown"
+                    ),
+                    "file_size": self.encoder.format_file_size(video_info.file_size),
+                },
             )
 
             # Trigger AI analysis if enabled (for preview only)
@@ -1503,8 +1784,7 @@ def load_video_info(self, file_path):
                 # update_ai_encoding_settings(self, file_path)
         else:
             # Clear info if loading failed
-            for label in self.info_labels.values():
-                label.configure(text="N/A")
+            set_info_fields(self, dict.fromkeys(self._info_vars, "N/A"))
 
     self.thread_manager.run_with_progress(
         target_func=load_info,
@@ -1514,9 +1794,25 @@ def load_video_info(self, file_path):
     )
 
 
-def on_folder_loaded(self, files):
+def set_info_fields(self, values):
+    """Update video info labels, skipping fields whose text is unchanged."""
+    shown = self._info_text
+    info_vars = self._info_vars
+    for key, text in values.items():
+        if shown.get(key) != text:
+            shown[key] = text
+            info_vars[key].set(text)
+
+
+def on_folder_loaded(self, scan, files):
     """Handle folder loading completion."""
-    self.selected_files = files
+    if scan is not self._folder_scan:
+        return
+    self._folder_scan = None
+    self.selected_files.extend(files)
+    # Batches arrive in directory order; restore the sorted order of a full scan
+    self.selected_files.sort()
+    files = self.selected_files
     self.status_var.set(f"Found {len(files)} video files")
     if files:
         # Load info for first file as preview
@@ -1536,12 +1832,11 @@ def toggle_resource_analytics(self):
             # Update status
             self.analytics_status_label.configure(text="● Enabled", foreground="green")
             show_toast(
-                self,
                 "Resource Analytics Enabled",
                 "Monitoring will start when encoding begins.",
             )
 
-            if DEBUG:
+            if __debug__ and DEBUG:
                 print("Resource analytics enabled")
         else:
             # Disable analytics
@@ -1551,11 +1846,9 @@ def toggle_resource_analytics(self):
 
             # Update status
             self.analytics_status_label.configure(text="● Disabled", foreground="red")
-            show_toast(
-                self, "Resource Analytics Disabled", "Monitoring has been stopped."
-            )
+            show_toast("Resource Analytics Disabled", "Monitoring has been stopped.")
 
-            if DEBUG:
+            if __debug__ and DEBUG:
                 print("Resource analytics disabled")
 
     except ImportError as e:
@@ -1565,86 +1858,98 @@ def toggle_resource_analytics(self):
             text="● Error (Missing Dependencies)", foreground="red"
         )
         show_toast(
-            self,
             "Dependencies Missing",
             "Please install: pip install matplotlib psutil",
         )
-        if DEBUG:
+        if __debug__ and DEBUG:
             print(f"Resource analytics import error: {e}")
     except Exception as e:
         # Handle other errors
         self.resource_analytics_enabled.set(False)
         self.analytics_status_label.configure(text="● Error", foreground="red")
-        show_toast(self, "Error", f"Failed to toggle analytics: {str(e)}")
-        if DEBUG:
+        show_toast("Error", f"Failed to toggle analytics: {str(e)}")
+        if __debug__ and DEBUG:
             print(f"Error toggling resource analytics: {e}")
 
 
-def start_encoding(self):
-    """Start the encoding process."""
-    # IMMEDIATE UI feedback - disable button and show status FIRST
-    self.start_btn.configure(state=DISABLED)
-    self.stop_btn.configure(state="normal")
-    self.status_var.set("Initializing encoding process...")
+def _set_running(self, running):
+    """Toggle the start/stop buttons for the encoding state."""
+    self.start_btn.state([DISABLED if running else f"!{DISABLED}"])
+    self.stop_btn.state([f"!{DISABLED}" if running else DISABLED])
 
-    # Force immediate UI update
-    self.update()
 
+def _validate_encode_request(self):
+    """Warn and return False if the encode can't start yet."""
     if not self.selected_files:
         messagebox.showwarning("No Files", "Please select files to encode.")
-        # Re-enable button if validation fails
-        self.start_btn.configure(state="normal")
-        self.stop_btn.configure(state=DISABLED)
-        return
+        return False
+
+    if self._folder_scan is not None:
+        messagebox.showwarning("Scanning", "Please wait for the folder scan to finish.")
+        return False
 
     if not self.output_dir_var.get():
         messagebox.showwarning("No Output", "Please select output directory.")
-        # Re-enable button if validation fails
-        self.start_btn.configure(state="normal")
-        self.stop_btn.configure(state=DISABLED)
-        return
+        return False
+    return True
 
-    # Update encoding settings from GUI
-    update_encoding_settings_from_gui(self)
 
-    # Refresh system information for optimal encoding settings
+def _refresh_system_info(self):
+    """Refresh system detection before an encode and update the System tab."""
     try:
         self.status_var.set("Updating system information for optimal performance...")
-        self.update()
+        self.update_idletasks()
 
         # Force refresh of system detection to get latest capabilities
         system_specs, optimal_settings = self.encoder.refresh_system_info()
 
         # Update system tab display if system info is available
         if system_specs and optimal_settings and hasattr(self, "system_info_dict"):
-            self.system_info_dict = {
-                "cpu_physical_cores": system_specs.cpu_cores_physical,
-                "cpu_logical_cores": system_specs.cpu_cores_logical,
-                "cpu_brand": system_specs.cpu_brand,
-                "memory_total_gb": system_specs.memory_total_gb,
-                "memory_available_gb": system_specs.memory_available_gb,
-                "gpu_info": system_specs.gpu_info,
-                "hw_acceleration": system_specs.hw_acceleration,
-                "ffmpeg_encoders": system_specs.ffmpeg_encoders,
-                "optimal_threads": optimal_settings.optimal_threads,
-                "conservative_threads": optimal_settings.conservative_threads,
-                "preferred_hwaccel": optimal_settings.preferred_hwaccel,
-                "buffer_size": optimal_settings.buffer_size,
-                "mux_queue_size": optimal_settings.mux_queue_size,
-                "reasoning": optimal_settings.reasoning,
-            }
+            # Refresh the existing dict in place; the System tab keys off its contents
+            self.system_info_dict.update(
+                build_system_info_dict(system_specs, optimal_settings)
+            )
             # Update system display with current info
             create_system_display_handler(self)
 
         self.status_var.set(
             f"System optimized - using {optimal_settings.optimal_threads if optimal_settings else 8} threads"
         )
-        self.update()
+        self.update_idletasks()
 
     except Exception as e:
-        print(f"DEBUG: System info update failed: {e}")
+        if __debug__ and DEBUG:
+            print(f"DEBUG: System info update failed: {e}")
         self.status_var.set("Warning: Using default encoding settings")
 
+
+def start_encoding(self):
+    """Start the encoding process."""
+    # Ignore repeat clicks while a job is already starting or running
+    if self.start_btn.instate([DISABLED]):
+        return
+
+    # IMMEDIATE UI feedback - disable button and show status FIRST
+    _set_running(self, True)
+    self.status_var.set("Initializing encoding process...")
+
+    # Force immediate redraw without processing queued clicks
+    self.update_idletasks()
+
+    if not _validate_encode_request(self):
+        # Re-enable button if validation fails
+        _set_running(self, False)
+        return
+
+    # The encode probes its own files; don't compete with it
+    self._probe_warmup = None
+
+    # Update encoding settings from GUI
+    update_encoding_settings_from_gui(self)
+
+    # Refresh system information for optimal encoding settings
+    _refresh_system_info(self)
+
     # Reset stop flag
     self.thread_manager.reset_stop_flag()
 
@@ -1657,37 +1962,39 @@ def start_encoding(self):
     ):
         try:
             self.status_var.set("Starting resource monitoring...")
-            self.update()
+            self.update_idletasks()
             self.resource_analytics.start_monitoring()
-            if DEBUG:
+            if __debug__ and DEBUG:
                 print("Resource analytics monitoring started")
         except Exception as e:
-            if DEBUG:
+            if __debug__ and DEBUG:
                 print(f"Failed to start resource analytics: {e}")
-            show_toast(self, "Analytics Warning", "Resource monitoring failed to start")
+            show_toast("Analytics Warning", "Resource monitoring failed to start")
 
-    print("DEBUG: Starting encoding thread...")
+    if __debug__ and DEBUG:
+        print("DEBUG: Starting encoding thread...")
 
     # Start encoding in background thread using simple threading
-    import threading
-
     def encoding_thread():
         try:
-            print("DEBUG: Encoding thread started, calling encode_all_files...")
+            if __debug__ and DEBUG:
+                print("DEBUG: Encoding thread started, calling encode_all_files...")
             success = encode_all_files(self)
-            print(f"DEBUG: encode_all_files returned: {success}")
+            if __debug__ and DEBUG:
+                print(f"DEBUG: encode_all_files returned: {success}")
             # Update UI from main thread
-            self.after(0, lambda: on_encoding_complete(self, success))
+            self._ui_queue.put(lambda: on_encoding_complete(self, success))
         except Exception as e:
             print(f"ERROR: Encoding thread error: {e}")
             import traceback
 
             traceback.print_exc()
-            self.after(0, lambda: on_encoding_complete(self, False))
+            self._ui_queue.put(lambda: on_encoding_complete(self, False))
 
     thread = threading.Thread(target=encoding_thread, daemon=True)
     thread.start()
-    print("DEBUG: Encoding thread started successfully")
+    if __debug__ and DEBUG:
+        print("DEBUG: Encoding thread started successfully")
 
 
 def encode_all_files(self):
@@ -1695,104 +2002,127 @@ def encode_all_files(self):
     total_files = len(self.selected_files)
 
     # Immediately update UI with file count and show we're starting
-    self.after(0, lambda: self.status_var.set(f"Processing {total_files} file(s)..."))
-    self.after(0, lambda: self.current_file_var.set("Preparing files for encoding..."))
-
-    # Small delay to ensure UI updates are visible
-    import time
-
-    time.sleep(0.1)
+    _post_ui_vars(self, status_var=f"Processing {total_files} file(s)...")
+    _post_ui_vars(self, current_file_var="Preparing files for encoding...")
 
     # Get the original base path for folder structure
     original_base_path = None
     if self.processing_mode.get() == "folder":
         original_base_path = self.selected_path_var.get()
 
-    for i, file_path in enumerate(self.selected_files):
-        # Check if stop was requested
-        if self.thread_manager.stop_requested:
-            self.after(0, lambda: self.current_file_var.set("Encoding stopped by user"))
-            return False
-
-        # Update current file display immediately
-        file_name = os.path.basename(file_path)
-        self.after(
-            0, lambda fn=file_name: self.current_file_var.set(f"Processing: {fn}")
-        )
-
-        # Generate output path first to check for conflicts
-        current_encoding_settings = self.encoding_settings
-        output_path = self.encoder.get_output_path(
+    # Snapshot the Tk state once; per-file workers must not read Tk variables
+    jobs = max(1, min(self.parallel_jobs_var.get(), total_files))
+    settings_codec = self.encoding_settings.video_codec
+    if jobs > 1 and self.encoder.select_video_encoder(settings_codec) != settings_codec:
+        # Consumer GPUs cap concurrent hardware encode sessions; run one at a time
+        jobs = 1
+    optimal_threads = getattr(self.encoder.optimal_settings, "optimal_threads", 8)
+    output_dir = self.output_dir_var.get()
+    maintain_structure = self.maintain_structure_var.get()
+    job = {
+        "ai_enabled": self.ai_encoding_var.get(),
+        # Split the thread budget so parallel ffmpeg runs don't oversubscribe
+        "threads": max(1, optimal_threads // jobs) if jobs > 1 else None,
+        # Segments already use every core; only split when files run one at a time
+        "segmented": jobs == 1 and self.segment_encode_var.get(),
+    }
+    # Resolve every output path and overwrite check in one pass up front,
+    # column-wise alongside selected_files
+    job["outputs"] = [
+        self.encoder.get_output_path(
             file_path,
-            self.output_dir_var.get(),
-            current_encoding_settings,
-            self.maintain_structure_var.get(),
+            output_dir,
+            self.encoding_settings,
+            maintain_structure,
             original_base_path,
         )
+        for file_path in self.selected_files
+    ]
+    job["exists"] = [os.path.exists(output_path) for output_path in job["outputs"]]
+    self._file_progress = [0.0] * total_files
+
+    files = self.selected_files
+    job["active"] = True
+    if jobs == 1:
+        # Analyse the next file while the current one encodes; on failure the
+        # look-ahead is abandoned rather than waited for
+        analyzer = ThreadPoolExecutor(max_workers=1)
+        try:
+            next_prepared = analyzer.submit(_prepare_one, self, files[0], job)
+            for i, file_path in enumerate(files):
+                prepared = next_prepared.result()
+                if i + 1 < total_files:
+                    next_prepared = analyzer.submit(
+                        _prepare_one, self, files[i + 1], job
+                    )
+                if not _encode_one(self, i, file_path, total_files, job, prepared):
+                    job["active"] = False
+                    return False
+        finally:
+            analyzer.shutdown(wait=False)
+    else:
+        # ffmpeg does the work in its own process; pool threads only wait on it
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_encode_one, self, i, file_path, total_files, job)
+                for i, file_path in enumerate(self.selected_files)
+            ]
+            for future in as_completed(futures):
+                if not future.result():
+                    # Let running encodes finish, but don't start any more
+                    job["active"] = False
+                    for pending in futures:
+                        pending.cancel()
+                    return False
+
+    if __debug__ and DEBUG:
+        print("DEBUG: All files processed successfully, returning True")
+    return True
 
-        # Check if output file already exists
-        if os.path.exists(output_path):
-            # Show immediate warning about file overwrite
-            self.after(
-                0,
-                lambda: self.status_var.set(
-                    f"Warning: Will overwrite existing file {os.path.basename(output_path)}"
-                ),
-            )
-            print(f"DEBUG: Output file already exists: {output_path}")
 
-        # Perform AI analysis if enabled
-        if self.ai_encoding_var.get():
-            try:
-                # Show immediate status that AI analysis is starting
-                self.after(
-                    0,
-                    lambda fn=file_name: self.status_var.set(
-                        f"AI analyzing video: {fn}"
-                    ),
-                )
-                self.after(
-                    0, lambda: self.current_file_var.set("Loading video information...")
-                )
+def _prepare_one(self, file_path, job):
+    """Probe one file and run AI analysis if enabled; returns (video_info, settings)."""
+    file_name = os.path.basename(file_path)
 
-                # Load video info for this file
-                video_info = self.encoder.get_video_info(file_path)
-                if video_info:
-                    # Show video info immediately
-                    self.after(
-                        0,
-                        lambda vi=video_info, fn=file_name: self.current_file_var.set(
-                            f"Video: {fn} - {vi.width}x{vi.height} ({vi.duration:.1f}s)"
-                        ),
-                    )
+    def post(**values):
+        # An abandoned look-ahead must not overwrite the batch's final status
+        if job["active"]:
+            _post_ui_vars(self, **values)
 
-                    # Update status before analysis
-                    self.after(
-                        0,
-                        lambda fn=file_name: self.status_var.set(
-                            f"AI optimizing encoding for {fn}..."
-                        ),
-                    )
+    # Probed once per file (cached); reused for AI analysis and progress timing
+    video_info = self.encoder.get_video_info(file_path)
+
+    # Perform AI analysis if enabled
+    encoding_settings = self.encoding_settings
+    if job["ai_enabled"] and not self.thread_manager.stop_requested:
+        try:
+            # Show immediate status that AI analysis is starting
+            post(status_var=f"AI analyzing video: {file_name}")
+            if video_info:
+                # Show video info immediately
+                post(
+                    current_file_var=f"Video: {file_name} - {video_info.width}x{video_info.height} ({video_info.duration:.1f}s)",
+                )
 
-                    # Perform AI analysis for this specific file
+                # Update status before analysis
+                post(status_var=f"AI optimizing encoding for {file_name}...")
+
+                # Perform AI analysis for this specific file
+                if __debug__ and DEBUG:
                     print(f"DEBUG: Starting AI analysis for {file_name}")
 
-                    # Create progress callback for AI analysis
-                    def ai_progress_callback(progress, status):
-                        self.after(
-                            0,
-                            lambda p=progress, s=status: self.status_var.set(
-                                f"AI Analysis: {s} ({p}%)"
-                            ),
-                        )
-                        self.after(0, lambda p=progress: self.progress_var.set(p))
-
-                    analysis, optimized_settings = self.ai_analyzer.analyze_video(
-                        file_path, video_info, ai_progress_callback
-                    )
-                    current_encoding_settings = optimized_settings
+                # Create progress callback for AI analysis; the progress bar is
+                # left to the encode that may be running alongside
+                def ai_progress_callback(progress, status):
+                    post(status_var=f"AI Analysis: {status} ({progress}%)")
 
-                    # Debug output for AI results
+                analysis, optimized_settings = self.ai_analyzer.analyze_video(
+                    file_path, video_info, ai_progress_callback
+                )
+                encoding_settings = optimized_settings
+
+                # Debug output for AI results
+                if __debug__ and DEBUG:
                     print(f"DEBUG: AI Analysis Results for {file_name}:")
                     print(f"  - Complexity Score: {analysis.complexity_score}")
                     print(f"  - Motion Level: {analysis.motion_level}")
@@ -1801,118 +2131,180 @@ def encode_all_files(self):
                     print(f"  - Has Fine Details: {analysis.has_fine_details}")
                     print(f"  - Has Grain: {analysis.has_grain}")
 
-                    # Debug output for optimized settings
+                # Debug output for optimized settings
+                if __debug__ and DEBUG:
                     print("DEBUG: Optimized encoding settings:")
                     print(f"  - Video Codec: {optimized_settings.video_codec}")
                     print(f"  - CRF: {optimized_settings.crf}")
                     print(f"  - Preset: '{optimized_settings.preset}'")
                     print(f"  - Output Format: {optimized_settings.output_format}")
 
-                    # Update status with AI analysis results
-                    self.after(
-                        0,
-                        lambda a=analysis, fn=file_name: self.status_var.set(
-                            f"AI optimized {fn}: CRF {a.recommended_crf}, {a.recommended_preset} preset"
-                        ),
-                    )
-            except Exception as e:
-                print(f"AI analysis failed for {file_name}: {e}")
-                self.after(
-                    0,
-                    lambda fn=file_name: self.status_var.set(
-                        f"AI analysis failed for {fn}, using default settings"
-                    ),
+                # Update status with AI analysis results
+                post(
+                    status_var=f"AI optimized {file_name}: CRF {analysis.recommended_crf}, {analysis.recommended_preset} preset",
                 )
-                # Continue with default settings
+        except Exception as e:
+            print(f"AI analysis failed for {file_name}: {e}")
+            post(
+                status_var=f"AI analysis failed for {file_name}, using default settings",
+            )
+            # Continue with default settings
+
+    return video_info, encoding_settings
+
 
-        # Update status before encoding starts
-        self.after(
-            0, lambda fn=file_name: self.status_var.set(f"Starting encode: {fn}")
+def _encode_one(self, i, file_path, total_files, job, prepared=None):
+    """Encode one file of the batch; returns False if the batch should stop."""
+    # Check if stop was requested
+    if self.thread_manager.stop_requested:
+        _post_ui_vars(self, current_file_var="Encoding stopped by user")
+        return False
+
+    # Analysis may already have run ahead of this encode
+    if prepared is None:
+        prepared = _prepare_one(self, file_path, job)
+    video_info, current_encoding_settings = prepared
+
+    # Update current file display immediately
+    file_name = os.path.basename(file_path)
+    _post_ui_vars(self, current_file_var=f"Processing: {file_name}")
+
+    output_path = job["outputs"][i]
+
+    # Check if output file already exists
+    if job["exists"][i]:
+        # Show immediate warning about file overwrite
+        _post_ui_vars(
+            self,
+            status_var=f"Warning: Will overwrite existing file {os.path.basename(output_path)}",
         )
+        if __debug__ and DEBUG:
+            print(f"DEBUG: Output file already exists: {output_path}")
 
-        # Encode file
-        try:
+    # Update status before encoding starts
+    _post_ui_vars(self, status_var=f"Starting encode: {file_name}")
+
+    # Encode file
+    try:
+        if __debug__ and DEBUG:
             print(f"DEBUG: Starting encoding for {file_name}")
-            success = self.encoder.encode_video(
-                file_path,
-                output_path,
-                current_encoding_settings,
-                progress_callback=lambda p, s: update_encoding_progress(
-                    self, i, total_files, p, s
-                ),
-                stop_flag_callback=lambda: self.thread_manager.stop_requested,
-            )
+        encode = (
+            self.encoder.encode_video_segmented
+            if job["segmented"]
+            else self.encoder.encode_video
+        )
+        success = encode(
+            file_path,
+            output_path,
+            current_encoding_settings,
+            progress_callback=lambda p, s: update_encoding_progress(
+                self, i, total_files, p, s
+            ),
+            stop_flag_callback=lambda: self.thread_manager.stop_requested,
+            total_duration=video_info.duration if video_info else None,
+            threads=job["threads"],
+            video_info=video_info,
+        )
+        if __debug__ and DEBUG:
             print(f"DEBUG: Encoding result for {file_name}: {success}")
-        except FileExistsError:
-            error_msg = f"File already exists: {os.path.basename(output_path)}"
-            print(f"ERROR: {error_msg}")
-            self.after(
-                0, lambda msg=error_msg: messagebox.showerror("File Exists", msg)
-            )
-            return False
-        except PermissionError:
-            error_msg = f"Permission denied writing to: {os.path.basename(output_path)}"
-            print(f"ERROR: {error_msg}")
-            self.after(
-                0, lambda msg=error_msg: messagebox.showerror("Permission Error", msg)
-            )
-            return False
-        except Exception as e:
-            error_msg = f"Encoding failed for {file_name}: {str(e)}"
-            print(f"ERROR: {error_msg}")
-            import traceback
+    except FileExistsError:
+        error_msg = f"File already exists: {os.path.basename(output_path)}"
+        print(f"ERROR: {error_msg}")
+        self._ui_queue.put(
+            lambda msg=error_msg: messagebox.showerror("File Exists", msg)
+        )
+        return False
+    except PermissionError:
+        error_msg = f"Permission denied writing to: {os.path.basename(output_path)}"
+        print(f"ERROR: {error_msg}")
+        self._ui_queue.put(
+            lambda msg=error_msg: messagebox.showerror("Permission Error", msg)
+        )
+        return False
+    except Exception as e:
+        error_msg = f"Encoding failed for {file_name}: {str(e)}"
+        print(f"ERROR: {error_msg}")
+        import traceback
 
-            traceback.print_exc()
-            self.after(
-                0, lambda msg=error_msg: messagebox.showerror("Encoding Error", msg)
-            )
-            return False
+        traceback.print_exc()
+        self._ui_queue.put(
+            lambda msg=error_msg: messagebox.showerror("Encoding Error", msg)
+        )
+        return False
 
-        # Check if stop was requested during encoding
-        if self.thread_manager.stop_requested:
+    # Check if stop was requested during encoding
+    if self.thread_manager.stop_requested:
+        if __debug__ and DEBUG:
             print("DEBUG: Stop was requested during encoding")
-            self.after(0, lambda: self.current_file_var.set("Encoding stopped by user"))
-            return False
+        _post_ui_vars(self, current_file_var="Encoding stopped by user")
+        return False
 
-        if not success:
+    if not success:
+        if __debug__ and DEBUG:
             print(f"DEBUG: Encoding failed for {file_name} - success was False")
-            return False
+        return False
 
-    print("DEBUG: All files processed successfully, returning True")
+    self._file_progress[i] = 100.0
     return True
 
 
 def update_encoding_progress(self, current_file, total_files, file_progress, status):
     """Update encoding progress during encoding."""
-    overall_progress = (current_file / total_files) * 100 + (
-        file_progress / total_files
-    )
+    # file_progress is 0-100 for this file; each file is 1/total_files, and
+    # files may be encoding in parallel
+    self._file_progress[current_file] = file_progress
+    overall_progress = sum(self._file_progress) / total_files
 
     status_text = f"File {current_file + 1}/{total_files}: {status}"
 
-    # Update UI in main thread using after()
-    self.after(0, lambda: self.progress_var.set(overall_progress))
-    self.after(0, lambda: self.status_var.set(status_text))
+    # Bursts of ffmpeg progress collapse into the latest values per UI tick
+    _post_ui_vars(self, progress_var=overall_progress, status_var=status_text)
+
+
+def _post_ui_vars(self, **values):
+    """Record the latest value for Tk variables; applied on the next UI tick."""
+    with self._ui_vars_lock:
+        self._pending_ui_vars.update(values)
+
+
+def _drain_ui_queue(self):
+    """Run queued UI updates from worker threads, then reschedule."""
+    # Apply variable updates first so completion callbacks get the last word
+    with self._ui_vars_lock:
+        pending, self._pending_ui_vars = self._pending_ui_vars, {}
+    for name, value in pending.items():
+        getattr(self, name).set(value)
+
+    for _ in range(_UI_QUEUE_BATCH):
+        try:
+            callback = self._ui_queue.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            callback()
+        except Exception as e:
+            if __debug__ and DEBUG:
+                print(f"UI queue callback error: {e}")
+    self.after(_UI_QUEUE_INTERVAL_MS, partial(_drain_ui_queue, self))
 
 
 def update_progress(self, progress, status):
     """Update progress bar and status."""
-    # Update UI in main thread using after()
-    self.after(0, lambda: self.progress_var.set(progress))
-    self.after(0, lambda: self.status_var.set(status))
+    # Queue UI updates for the main thread
+    _post_ui_vars(self, progress_var=progress, status_var=status)
 
 
 def on_encoding_complete(self, success):
     """Handle encoding completion."""
-    print(f"DEBUG: Encoding completed with success={success}")
+    if __debug__ and DEBUG:
+        print(f"DEBUG: Encoding completed with success={success}")
 
     # Stop resource analytics monitoring
     if hasattr(self, "resource_analytics") and self.resource_analytics:
         self.resource_analytics.stop_monitoring_process()
 
     # Re-enable controls
-    self.start_btn.configure(state="normal")
-    self.stop_btn.configure(state=DISABLED)
+    _set_running(self, False)
 
     if success:
         self.status_var.set("Encoding completed successfully!")
@@ -1941,22 +2333,21 @@ def stop_encoding(self):
     self.thread_manager.stop_current_operation()
 
     # Update UI immediately
-    self.start_btn.configure(state="normal")
-    self.stop_btn.configure(state=DISABLED)
+    _set_running(self, False)
     self.status_var.set("Stopping encoding...")
     self.current_file_var.set("Stopping...")
 
 
 def clear_all(self):
     """Clear all selections and reset interface."""
+    self._folder_scan = self._probe_warmup = None
     self.selected_files = []
     self.selected_path_var.set("No file selected")
     self.output_dir_var.set("")
     self.current_video_info = None
 
     # Clear video info
-    for label in self.info_labels.values():
-        label.configure(text="N/A")
+    set_info_fields(self, dict.fromkeys(self._info_vars, "N/A"))
 
     # Reset progress
     self.progress_var.set(0)
@@ -1966,30 +2357,23 @@ def clear_all(self):
 
 def update_encoding_settings_from_gui(self):
     """Update encoding settings from GUI values."""
-    self.encoding_settings.video_codec = self.encoder.VIDEO_CODECS.get(
-        self.video_codec_var.get(), "libx264"
-    )
-    self.encoding_settings.video_bitrate = self.video_bitrate_var.get()
-    self.encoding_settings.resolution = self.resolution_var.get()
-    self.encoding_settings.fps = self.fps_var.get()
-    self.encoding_settings.crf = self.crf_var.get()
-    self.encoding_settings.preset = self.preset_var.get()
-
-    self.encoding_settings.audio_codec = self.encoder.AUDIO_CODECS.get(
-        self.audio_codec_var.get(), "aac"
-    )
-    self.encoding_settings.audio_bitrate = self.audio_bitrate_var.get()
-    self.encoding_settings.audio_sample_rate = self.audio_sample_rate_var.get()
-    self.encoding_settings.audio_channels = self.audio_channels_var.get()
+    settings = self.encoding_settings
+    encoder = self.encoder
+
+    for var_attr, settings_attr, table_attr, default in _CODEC_BINDINGS:
+        codecs = getattr(encoder, table_attr)
+        value = codecs.get(getattr(self, var_attr).get(), default)
+        setattr(settings, settings_attr, value)
 
-    self.encoding_settings.output_format = self.output_format_var.get()
-    self.encoding_settings.output_directory = self.output_dir_var.get()
+    for var_attr, settings_attr in _SETTINGS_BINDINGS:
+        setattr(settings, settings_attr, getattr(self, var_attr).get())
 
-    print("DEBUG: Updated encoding settings:")
-    print(f"  Video Codec: {self.encoding_settings.video_codec}")
-    print(f"  CRF: {self.encoding_settings.crf}")
-    print(f"  Preset: {self.encoding_settings.preset}")
-    print(f"  Output Format: {self.encoding_settings.output_format}")
+    if __debug__ and DEBUG:
+        print("DEBUG: Updated encoding settings:")
+        print(f"  Video Codec: {self.encoding_settings.video_codec}")
+        print(f"  CRF: {self.encoding_settings.crf}")
+        print(f"  Preset: {self.encoding_settings.preset}")
+        print(f"  Output Format: {self.encoding_settings.output_format}")
 
 
 # Main function to initialize GUI
@@ -1998,5 +2382,5 @@ def main_ui(self):
     # Initialize the GUI
     create_main_gui(self)
 
-    if DEBUG:
+    if __debug__ and DEBUG:
         print("ENCODER GUI INITIALIZED")
@@ -27,14 +27,57 @@ Dependencies:
 - pathlib: Modern file system operations
 """
 
+import atexit
 import os
+import platform
+import shelve
 import subprocess
 import json
-from typing import List, Optional
-from dataclasses import dataclass
+import tempfile
+from collections import OrderedDict, deque
+from math import gcd
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from threading import Event, Lock, Thread
+from typing import Iterator, List, Optional, Tuple
+from dataclasses import dataclass, replace
 from pathlib import Path
 from Functions import DEBUG
-from system_detector import SystemDetector, SystemSpecs, OptimalSettings
+from system_detector import SystemDetector, SystemSpecs, OptimalSettings, find_ffmpeg
+
+try:
+    # Optional: reads metadata in-process instead of spawning ffprobe per file
+    import av
+except ImportError:
+    av = None
+
+# Probe results persisted across sessions; opened on first probe
+_probe_db = None
+_probe_db_lock = Lock()
+
+
+def _open_probe_db():
+    """Open the on-disk probe cache once per process; None if unavailable."""
+    global _probe_db
+    if _probe_db is None:
+        _probe_db = False  # Don't retry a cache that failed to open
+        if platform.system() == "Windows":
+            base = os.getenv("LOCALAPPDATA", os.path.expanduser("~/AppData/Local"))
+        else:
+            base = os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        path = Path(base) / "HoffUI_Encoder" / "probe"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = shelve.open(str(path))
+            # Entries for moved or edited files are never looked up again
+            if len(db) > FFMPEGEncoder.PROBE_DB_MAX_ENTRIES:
+                db.clear()
+            atexit.register(db.close)
+            _probe_db = db
+        except Exception as e:
+            if DEBUG:
+                print(f"DEBUG: Probe cache unavailable: {e}")
+    # An empty shelf is falsy, so compare against the failure marker
+    return None if _probe_db is False else _probe_db
 
 
 @dataclass
@@ -64,6 +107,7 @@ class EncodingSettings:
     fps: str = "Original"  # Original, 24, 30, 60
     crf: int = 23  # Constant Rate Factor (0-51, lower = better quality)
     preset: str = "medium"  # ultrafast, superfast, veryfast, etc.
+    aq_mode: int = 3  # x264/x265 adaptive quantization (3 = auto-variance, dark bias)
 
     # Audio settings
     audio_codec: str = "aac"
@@ -74,6 +118,7 @@ class EncodingSettings:
     # Output settings
     output_format: str = "mp4"
     output_directory: str = ""
+    copy_matching_streams: bool = False  # Remux inputs already in target codecs
 
 
 class FFMPEGEncoder:
@@ -95,6 +140,11 @@ class FFMPEGEncoder:
         ".vob",
         ".ogv",
     ]
+    # Extension set for O(1) membership checks
+    VIDEO_EXTENSIONS = frozenset(SUPPORTED_VIDEO_FORMATS)
+    # Containers whose header carries duration, size and frame rate; MPEG
+    # program and transport streams only reveal them by reading packets
+    FAST_PROBE_FORMATS = VIDEO_EXTENSIONS - {".ts", ".mpg", ".mpeg", ".vob"}
 
     VIDEO_CODECS = {
         "H.264 (libx264)": "libx264",
@@ -124,6 +174,79 @@ class FFMPEGEncoder:
         "veryslow",
     ]
 
+    # Hardware encoders that stand in for a software codec, keyed by the
+    # detected -hwaccel method; used only if ffmpeg lists the encoder
+    HW_VIDEO_ENCODERS = {
+        "cuda": {"libx264": "h264_nvenc", "libx265": "hevc_nvenc"},
+        "qsv": {"libx264": "h264_qsv", "libx265": "hevc_qsv"},
+        "vaapi": {"libx264": "h264_vaapi", "libx265": "hevc_vaapi"},
+        "videotoolbox": {
+            "libx264": "h264_videotoolbox",
+            "libx265": "hevc_videotoolbox",
+        },
+    }
+
+    # x264-style preset names mapped to NVENC's p1 (fastest) .. p7 (slowest)
+    NVENC_PRESETS = {
+        "ultrafast": "p1",
+        "superfast": "p1",
+        "veryfast": "p2",
+        "faster": "p3",
+        "fast": "p3",
+        "medium": "p4",
+        "slow": "p5",
+        "slower": "p6",
+        "veryslow": "p7",
+    }
+
+    # QSV accepts the x264 names from veryfast upwards
+    QSV_PRESETS = {"ultrafast": "veryfast", "superfast": "veryfast"}
+
+    VAAPI_DEVICE = "/dev/dri/renderD128"
+
+    # Stream codec names (as probed) that each encoder produces, used to spot
+    # inputs that can be remuxed instead of re-encoded
+    ENCODER_STREAM_CODECS = {
+        "libx264": "h264",
+        "libx265": "hevc",
+        "libvp9": "vp9",
+        "libvpx": "vp8",
+        "libaom-av1": "av1",
+        "aac": "aac",
+        "libmp3lame": "mp3",
+        "libopus": "opus",
+        "libvorbis": "vorbis",
+        "ac3": "ac3",
+    }
+
+    FASTSTART_FORMATS = frozenset(("mp4", "mov", "m4v"))
+
+    STOP_GRACE_SECONDS = 2
+
+    # Probe results held in memory, and the most kept on disk between sessions
+    PROBE_CACHE_SIZE = 2048
+    PROBE_DB_MAX_ENTRIES = 20000
+
+    # Segmented encodes: threads given to each segment's ffmpeg, and the
+    # shortest segment worth the extra keyframe and process start-up
+    SEGMENT_THREADS = 4
+    SEGMENT_MIN_SECONDS = 60
+
+    SIZE_UNITS = (("B", 1), ("KB", 1024), ("MB", 1024**2), ("GB", 1024**3))
+
+    PROGRESS_ARGS = ("-progress", "pipe:1", "-nostats", "-loglevel", "error")
+
+    # Directories listed at once while scanning a folder tree
+    SCAN_WORKERS = 8
+
+    # Demuxer limits for a header-only probe (bytes, microseconds)
+    FAST_PROBE_OPTIONS = {"probesize": "65536", "analyzeduration": "1"}
+
+    PROBE_ENTRIES = (
+        "stream=codec_type,codec_name,width,height,r_frame_rate"
+        ":format=duration,size,bit_rate"
+    )
+
     RESOLUTIONS = {
         "Original": None,
         "4K (3840x2160)": "3840x2160",
@@ -134,38 +257,22 @@ class FFMPEGEncoder:
     }
 
     def __init__(self):
-        self.ffmpeg_path = self._find_ffmpeg()
+        self.ffmpeg_path = find_ffmpeg()
         if not self.ffmpeg_path:
             raise RuntimeError(
                 "FFMPEG not found. Please install FFMPEG and add it to PATH."
             )
 
         # Initialize system detection and optimal settings
-        self.system_detector = SystemDetector()
+        self.system_detector = SystemDetector(self.ffmpeg_path)
         self.system_specs: Optional[SystemSpecs] = None
         self.optimal_settings: Optional[OptimalSettings] = None
         self._system_detected = False
 
-    def _find_ffmpeg(self) -> Optional[str]:
-        """Find FFMPEG executable in system PATH."""
-        try:
-            result = subprocess.run(["which", "ffmpeg"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-
-        # Check common locations
-        common_paths = [
-            "/usr/bin/ffmpeg",
-            "/usr/local/bin/ffmpeg",
-            "/opt/ffmpeg/bin/ffmpeg",
-        ]
-        for path in common_paths:
-            if os.path.exists(path):
-                return path
-
-        return None
+        # Successful probes keyed by (path, mtime, size), least recently used
+        # first; an edited file gets a new key and misses
+        self._probe_cache = OrderedDict()
+        self._probe_cache_lock = Lock()
 
     def _ensure_system_detected(self):
         """Ensure system detection has been performed."""
@@ -231,18 +338,137 @@ class FFMPEGEncoder:
         print("=" * 60 + "\n")
 
     def get_video_info(self, file_path: str) -> Optional[VideoInfo]:
+        """Extract video information, probing only files changed since last seen."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        with self._probe_cache_lock:
+            video_info = self._probe_cache.get(key)
+            if video_info is not None:
+                self._probe_cache.move_to_end(key)
+                return video_info
+
+        video_info = self._probe_video(*key)
+        # Failed probes may be transient, so only successes are kept
+        if video_info is not None:
+            with self._probe_cache_lock:
+                self._probe_cache[key] = video_info
+                if len(self._probe_cache) > self.PROBE_CACHE_SIZE:
+                    self._probe_cache.popitem(last=False)
+        return video_info
+
+    def _probe_video(
+        self, file_path: str, mtime_ns: int, size: int
+    ) -> Optional[VideoInfo]:
+        """Look a probe up in the on-disk cache, probing the file on a miss."""
+        key = f"{file_path}\0{mtime_ns}\0{size}"
+        with _probe_db_lock:
+            db = _open_probe_db()
+            try:
+                video_info = db.get(key) if db is not None else None
+            except Exception:
+                video_info = None
+        if video_info is not None:
+            return video_info
+
+        video_info = self._read_video_info(file_path)
+        # Failed probes may be transient, so only successes are kept
+        if video_info is not None and db is not None:
+            with _probe_db_lock:
+                try:
+                    db[key] = video_info
+                except Exception:
+                    pass
+        return video_info
+
+    def _read_video_info(self, file_path: str) -> Optional[VideoInfo]:
+        """Extract video information, reading past the header only if needed."""
+        if os.path.splitext(file_path)[1].lower() in self.FAST_PROBE_FORMATS:
+            video_info = self._probe_file(file_path, self.FAST_PROBE_OPTIONS)
+            if (
+                video_info
+                and video_info.duration > 0
+                and video_info.width
+                and video_info.height
+                and video_info.fps > 0
+            ):
+                return video_info
+        return self._probe_file(file_path)
+
+    def _probe_file(
+        self, file_path: str, options: Optional[dict] = None
+    ) -> Optional[VideoInfo]:
+        """Probe in-process via PyAV when it is installed, else with ffprobe."""
+        if av is not None:
+            video_info = self._get_video_info_pyav(file_path, options)
+            if video_info is not None:
+                return video_info
+        return self._get_video_info_ffprobe(file_path, options)
+
+    def _get_video_info_pyav(
+        self, file_path: str, options: Optional[dict] = None
+    ) -> Optional[VideoInfo]:
+        """Read container headers with libavformat, without spawning ffprobe."""
+        try:
+            with av.open(file_path, options=options or {}) as container:
+                if not container.streams.video:
+                    return None
+                video_stream = container.streams.video[0]
+                audio_stream = next(iter(container.streams.audio), None)
+                width = video_stream.codec_context.width
+                height = video_stream.codec_context.height
+                rate = video_stream.average_rate
+
+                return VideoInfo(
+                    filename=os.path.basename(file_path),
+                    duration=(container.duration or 0) / av.time_base,
+                    width=width,
+                    height=height,
+                    aspect_ratio=self._aspect_ratio(width, height),
+                    video_codec=video_stream.codec_context.codec.canonical_name,
+                    audio_codec=(
+                        audio_stream.codec_context.codec.canonical_name
+                        if audio_stream
+                        else "None"
+                    ),
+                    bitrate=container.bit_rate or 0,
+                    file_size=os.path.getsize(file_path),
+                    fps=float(rate) if rate else 0,
+                )
+        except Exception as e:
+            # Let the ffprobe path have a go at anything PyAV can't read
+            if DEBUG:
+                print(f"PyAV could not read video info: {e}")
+            return None
+
+    @staticmethod
+    def _aspect_ratio(width: int, height: int) -> str:
+        """Reduce width x height to a W:H ratio string."""
+        if width and height:
+            aspect_gcd = gcd(width, height)
+            return f"{width // aspect_gcd}:{height // aspect_gcd}"
+        return "Unknown"
+
+    def _get_video_info_ffprobe(
+        self, file_path: str, options: Optional[dict] = None
+    ) -> Optional[VideoInfo]:
         """Extract video information using ffprobe."""
         try:
+            # Ask only for the fields read below, not every stream/format tag
             cmd = [
                 "ffprobe",
                 "-v",
                 "quiet",
                 "-print_format",
                 "json",
-                "-show_format",
-                "-show_streams",
-                file_path,
+                "-show_entries",
+                self.PROBE_ENTRIES,
             ]
+            for option, value in (options or {}).items():
+                cmd.extend([f"-{option}", value])
+            cmd.append(file_path)
 
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode != 0:
@@ -250,33 +476,23 @@ class FFMPEGEncoder:
 
             data = json.loads(result.stdout)
 
-            # Find video and audio streams
-            video_stream = None
-            audio_stream = None
-
-            for stream in data.get("streams", []):
-                if stream.get("codec_type") == "video" and not video_stream:
-                    video_stream = stream
-                elif stream.get("codec_type") == "audio" and not audio_stream:
-                    audio_stream = stream
-
+            # Find the first video and audio streams
+            streams = data.get("streams", [])
+            video_stream = next(
+                (s for s in streams if s.get("codec_type") == "video"), None
+            )
             if not video_stream:
                 return None
+            audio_stream = next(
+                (s for s in streams if s.get("codec_type") == "audio"), None
+            )
 
             # Extract video information
+            fmt = data.get("format") or {}
             width = int(video_stream.get("width", 0))
             height = int(video_stream.get("height", 0))
-            duration = float(data.get("format", {}).get("duration", 0))
-            file_size = int(data.get("format", {}).get("size", 0))
-
-            # Calculate aspect ratio
-            if width and height:
-                from math import gcd
-
-                aspect_gcd = gcd(width, height)
-                aspect_ratio = f"{width // aspect_gcd}:{height // aspect_gcd}"
-            else:
-                aspect_ratio = "Unknown"
+            duration = float(fmt.get("duration", 0))
+            file_size = int(fmt.get("size", 0))
 
             # Get frame rate
             fps_str = video_stream.get("r_frame_rate", "0/1")
@@ -287,14 +503,14 @@ class FFMPEGEncoder:
                 fps = float(fps_str)
 
             # Get bitrate
-            bitrate = int(data.get("format", {}).get("bit_rate", 0))
+            bitrate = int(fmt.get("bit_rate", 0))
 
             return VideoInfo(
                 filename=os.path.basename(file_path),
                 duration=duration,
                 width=width,
                 height=height,
-                aspect_ratio=aspect_ratio,
+                aspect_ratio=self._aspect_ratio(width, height),
                 video_codec=video_stream.get("codec_name", "Unknown"),
                 audio_codec=(
                     audio_stream.get("codec_name", "Unknown")
@@ -313,53 +529,104 @@ class FFMPEGEncoder:
 
     def find_video_files(self, directory: str, recursive: bool = True) -> List[str]:
         """Find all video files in directory."""
-        video_files = []
-
-        if recursive:
-            for root, dirs, files in os.walk(directory):
-                for file in files:
-                    if any(
-                        file.lower().endswith(ext)
-                        for ext in self.SUPPORTED_VIDEO_FORMATS
+        return sorted(self.iter_video_files(directory, recursive))
+
+    def iter_video_files(self, directory: str, recursive: bool = True) -> Iterator[str]:
+        """Yield video files in directory as they are found, unsorted."""
+        if not recursive:
+            yield from self._scan_directory(directory)[0]
+            return
+
+        # Listing is I/O-bound and scandir releases the GIL, so sibling
+        # directories are read concurrently; this matters most on network shares
+        pool = ThreadPoolExecutor(max_workers=self.SCAN_WORKERS)
+        try:
+            pending = {pool.submit(self._scan_directory, directory)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    yield from files
+                    pending.update(
+                        pool.submit(self._scan_directory, subdir) for subdir in subdirs
+                    )
+        finally:
+            # A caller that stops early shouldn't wait on the rest of the tree
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _scan_directory(self, directory: str) -> Tuple[List[str], List[str]]:
+        """List one directory's video files and subdirectories."""
+        files = []
+        subdirs = []
+        # scandir's DirEntry carries the file type, so no extra stat() per entry
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif (
+                        os.path.splitext(entry.name)[1].lower() in self.VIDEO_EXTENSIONS
                     ):
-                        video_files.append(os.path.join(root, file))
-        else:
-            for file in os.listdir(directory):
-                file_path = os.path.join(directory, file)
-                if os.path.isfile(file_path) and any(
-                    file.lower().endswith(ext) for ext in self.SUPPORTED_VIDEO_FORMATS
-                ):
-                    video_files.append(file_path)
+                        files.append(entry.path)
+        except OSError:
+            pass
+        return files, subdirs
 
-        return sorted(video_files)
+    def select_video_encoder(self, video_codec: str) -> str:
+        """Return the detected hardware encoder for video_codec, or video_codec itself."""
+        self._ensure_system_detected()
+        if not self.optimal_settings or not self.system_specs:
+            return video_codec
+
+        hw_encoders = self.HW_VIDEO_ENCODERS.get(
+            self.optimal_settings.preferred_hwaccel, {}
+        )
+        hw_encoder = hw_encoders.get(video_codec)
+        if hw_encoder and hw_encoder in self.system_specs.ffmpeg_encoders:
+            if DEBUG:
+                print(f"DEBUG: Using hardware encoder {hw_encoder} for {video_codec}")
+            return hw_encoder
+        return video_codec
 
     def build_ffmpeg_command(
-        self, input_path: str, output_path: str, settings: EncodingSettings
+        self,
+        input_path: str,
+        output_path: str,
+        settings: EncodingSettings,
+        threads: Optional[int] = None,
+        video_info: Optional[VideoInfo] = None,
     ) -> List[str]:
         """Build FFMPEG command based on encoding settings with dynamic system optimization."""
+        if self.can_stream_copy(settings, video_info):
+            return self._build_copy_command(input_path, output_path, settings)
+
         # Ensure system detection has been performed
         self._ensure_system_detected()
 
         cmd = [self.ffmpeg_path]
 
+        video_codec = self.select_video_encoder(settings.video_codec)
+        resolution = self.RESOLUTIONS.get(settings.resolution)
+
         # Add hardware acceleration if available (must be before input)
         if self.optimal_settings and self.optimal_settings.preferred_hwaccel:
             cmd.extend(["-hwaccel", self.optimal_settings.preferred_hwaccel])
+            # Keep decoded frames on the GPU for NVENC unless the CPU scaler needs them
+            if video_codec.endswith("_nvenc") and not resolution:
+                cmd.extend(["-hwaccel_output_format", "cuda"])
             if DEBUG:
                 print(
                     f"DEBUG: Using hardware acceleration: {self.optimal_settings.preferred_hwaccel}"
                 )
+        if video_codec.endswith("_vaapi"):
+            cmd.extend(["-vaapi_device", self.VAAPI_DEVICE])
 
-        # Input file
-        cmd.extend(["-i", input_path])
-
-        # Use dynamically detected optimal threading
-        optimal_threads = (
+        # Use dynamically detected optimal threading unless the caller splits it
+        optimal_threads = threads or (
             self.optimal_settings.optimal_threads if self.optimal_settings else 8
         )
-        cmd.extend(["-threads", str(optimal_threads)])
-
-        cmd.extend(["-strict", "-2"])  # Enable experimental features if needed
 
         # Use dynamic buffer settings based on system capabilities
         analyze_duration = (
@@ -372,34 +639,57 @@ class FFMPEGEncoder:
             self.optimal_settings.mux_queue_size if self.optimal_settings else 2048
         )
 
-        cmd.extend(["-analyzeduration", analyze_duration])
-        cmd.extend(["-probesize", probe_size])
-        cmd.extend(["-max_muxing_queue_size", str(mux_queue_size)])
-
-        # Add speed optimization flags
-        cmd.extend(["-fflags", "+fastseek+genpts"])
-        cmd.extend(["-avoid_negative_ts", "make_zero"])
-
-        # Video encoding settings
-        cmd.extend(["-c:v", settings.video_codec])
+        # Fixed-shape options in one extend: input, threading, buffers, speed
+        # flags and the video codec
+        cmd.extend(
+            (
+                "-i",
+                input_path,
+                "-threads",
+                str(optimal_threads),
+                "-strict",
+                "-2",  # Enable experimental features if needed
+                "-analyzeduration",
+                analyze_duration,
+                "-probesize",
+                probe_size,
+                "-max_muxing_queue_size",
+                str(mux_queue_size),
+                "-fflags",
+                "+fastseek+genpts",
+                "-avoid_negative_ts",
+                "make_zero",
+                "-c:v",
+                video_codec,
+            )
+        )
 
-        if settings.video_codec in ["libx264", "libx265"]:
-            cmd.extend(["-crf", str(settings.crf)])
-            cmd.extend(["-preset", settings.preset])
+        if video_codec in ("libx264", "libx265"):
+            cmd.extend(("-crf", str(settings.crf), "-preset", settings.preset))
 
             # Add codec-specific threading optimizations for speed
-            if settings.video_codec == "libx264":
-                # x264 threading optimizations for speed without quality loss
-                thread_count = optimal_threads
+            if video_codec == "libx264":
+                # Frame threading keeps every core busy; sliced threads trade
+                # compression for latency, which a file encode does not need
                 cmd.extend(
                     [
-                        "-x264opts",
-                        f"threads={thread_count}:sliced-threads=1:no-scenecut",
+                        "-x264-params",
+                        f"threads={optimal_threads}:sliced-threads=0:no-scenecut"
+                        f":aq-mode={settings.aq_mode}",
                     ]
                 )
-            elif settings.video_codec == "libx265":
+            elif video_codec == "libx265":
                 # x265 threading optimizations
-                cmd.extend(["-x265-params", f"pools={optimal_threads}:frame-threads=4"])
+                cmd.extend(
+                    [
+                        "-x265-params",
+                        f"pools={optimal_threads}:frame-threads=4"
+                        f":aq-mode={settings.aq_mode}",
+                    ]
+                )
+        else:
+            # Hardware encoders take the CRF value as their constant-quality level
+            cmd.extend(self._hw_quality_args(video_codec, settings))
 
         # Only add bitrate if it's specified and not empty (CRF mode doesn't need bitrate)
         if (
@@ -409,21 +699,62 @@ class FFMPEGEncoder:
         ):
             cmd.extend(["-b:v", settings.video_bitrate])
 
-        # Resolution
-        if (
-            settings.resolution != "Original"
-            and settings.resolution in self.RESOLUTIONS
-        ):
-            resolution = self.RESOLUTIONS[settings.resolution]
-            if resolution:
-                cmd.extend(["-vf", f"scale={resolution}"])
+        # Resolution, then upload to VAAPI surfaces for the VAAPI encoders
+        filters = []
+        if resolution:
+            filters.append(f"scale={resolution}")
+        if video_codec.endswith("_vaapi"):
+            filters.append("format=nv12,hwupload")
+        if filters:
+            cmd.extend(["-vf", ",".join(filters)])
 
         # Frame rate
         if settings.fps != "Original":
             cmd.extend(["-r", settings.fps])
 
         # Audio encoding settings
-        cmd.extend(["-c:a", settings.audio_codec])
+        cmd.extend(self._audio_args(settings))
+
+        # Output settings
+        cmd.extend(self._container_args(settings))
+        cmd.extend(["-y"])  # Overwrite output file
+        cmd.append(output_path)
+
+        return cmd
+
+    def can_stream_copy(
+        self, settings: EncodingSettings, video_info: Optional[VideoInfo]
+    ) -> bool:
+        """Check whether the input already matches the target and can be remuxed."""
+        if not settings.copy_matching_streams or video_info is None:
+            return False
+        # Any filter or resample needs decoded frames
+        if (
+            self.RESOLUTIONS.get(settings.resolution)
+            or settings.fps != "Original"
+            or settings.audio_sample_rate != "Original"
+            or settings.audio_channels != "Original"
+        ):
+            return False
+        streams = self.ENCODER_STREAM_CODECS
+        if video_info.video_codec != streams.get(settings.video_codec):
+            return False
+        # Inputs without audio have nothing to convert
+        return video_info.audio_codec in ("None", streams.get(settings.audio_codec))
+
+    def _build_copy_command(
+        self, input_path: str, output_path: str, settings: EncodingSettings
+    ) -> List[str]:
+        """Build a remux command that copies the video and audio streams as-is."""
+        cmd = [self.ffmpeg_path, "-i", input_path]
+        cmd.extend(("-c:v", "copy", "-c:a", "copy", "-avoid_negative_ts", "make_zero"))
+        cmd.extend(self._container_args(settings))
+        cmd.extend(["-y", output_path])
+        return cmd
+
+    def _audio_args(self, settings: EncodingSettings) -> List[str]:
+        """Audio codec, bitrate, sample rate and channel arguments."""
+        args = ["-c:a", settings.audio_codec]
 
         # Only add audio bitrate if it's specified and not empty
         if (
@@ -431,22 +762,40 @@ class FFMPEGEncoder:
             and settings.audio_bitrate != "Auto"
             and settings.audio_bitrate.strip()
         ):
-            cmd.extend(["-b:a", settings.audio_bitrate])
+            args.extend(["-b:a", settings.audio_bitrate])
 
         if settings.audio_sample_rate != "Original":
-            cmd.extend(["-ar", settings.audio_sample_rate])
+            args.extend(["-ar", settings.audio_sample_rate])
 
-        if settings.audio_channels != "Original":
-            if settings.audio_channels == "1":
-                cmd.extend(["-ac", "1"])
-            elif settings.audio_channels == "2":
-                cmd.extend(["-ac", "2"])
+        if settings.audio_channels in ("1", "2"):
+            args.extend(["-ac", settings.audio_channels])
 
-        # Output settings
-        cmd.extend(["-y"])  # Overwrite output file
-        cmd.append(output_path)
+        return args
 
-        return cmd
+    def _container_args(self, settings: EncodingSettings) -> List[str]:
+        """Muxer options for the output container."""
+        # Write the moov atom up front so MP4-family files play while downloading
+        if settings.output_format in self.FASTSTART_FORMATS:
+            return ["-movflags", "+faststart"]
+        return []
+
+    def _hw_quality_args(
+        self, video_codec: str, settings: EncodingSettings
+    ) -> List[str]:
+        """Rate-control and preset arguments for a hardware encoder."""
+        quality = str(settings.crf)
+        if video_codec.endswith("_nvenc"):
+            preset = self.NVENC_PRESETS.get(settings.preset, "p4")
+            return ["-preset", preset, "-tune", "hq", "-rc", "vbr", "-cq", quality]
+        if video_codec.endswith("_qsv"):
+            preset = self.QSV_PRESETS.get(settings.preset, settings.preset)
+            return ["-preset", preset, "-global_quality", quality]
+        if video_codec.endswith("_vaapi"):
+            return ["-rc_mode", "CQP", "-qp", quality]
+        if video_codec.endswith("_videotoolbox"):
+            # VideoToolbox quality runs 1-100, higher is better; CRF 23 lands near 56
+            return ["-q:v", str(max(1, min(100, (51 - settings.crf) * 2)))]
+        return []
 
     def encode_video(  # noqa
         self,
@@ -455,6 +804,9 @@ class FFMPEGEncoder:
         settings: EncodingSettings,
         progress_callback=None,
         stop_flag_callback=None,
+        total_duration: Optional[float] = None,
+        threads: Optional[int] = None,
+        video_info: Optional[VideoInfo] = None,
     ) -> bool:
         """Encode a single video file with fallback options for stability."""
         print(f"DEBUG: encode_video called with input_path={input_path}")
@@ -463,6 +815,16 @@ class FFMPEGEncoder:
         # Ensure system detection has been performed only once per encoder instance
         self._ensure_system_detected()
 
+        # Get video duration for progress calculation, unless the caller already
+        # probed the file; done once rather than per attempt
+        if video_info is None and (
+            total_duration is None or settings.copy_matching_streams
+        ):
+            video_info = self.get_video_info(input_path)
+        if total_duration is None:
+            total_duration = video_info.duration if video_info else 0
+        print(f"DEBUG: Video duration: {total_duration} seconds")
+
         # Try encoding with different stability levels
         for attempt in range(2):
             try:
@@ -470,7 +832,9 @@ class FFMPEGEncoder:
                 os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
                 # Build command (modify for fallback attempts)
-                cmd = self.build_ffmpeg_command(input_path, output_path, settings)
+                cmd = self.build_ffmpeg_command(
+                    input_path, output_path, settings, threads, video_info
+                )
 
                 # On second attempt, use more conservative settings
                 if attempt == 1:
@@ -483,6 +847,8 @@ class FFMPEGEncoder:
                         if self.optimal_settings
                         else 4
                     )
+                    if threads:
+                        conservative_threads = min(conservative_threads, threads)
 
                     # Build a new conservative command from scratch
                     cmd = [self.ffmpeg_path, "-i", input_path]
@@ -553,16 +919,12 @@ class FFMPEGEncoder:
                         elif settings.audio_channels == "2":
                             cmd.extend(["-ac", "2"])
 
+                    cmd.extend(self._container_args(settings))
                     cmd.extend(["-y"])  # Overwrite output file
                     cmd.append(output_path)
 
                 print(f"DEBUG: FFMPEG Command (attempt {attempt + 1}): {' '.join(cmd)}")
 
-                # Get video duration for progress calculation
-                video_info = self.get_video_info(input_path)
-                total_duration = video_info.duration if video_info else 0
-                print(f"DEBUG: Video duration: {total_duration} seconds")
-
                 # Start encoding process
                 print(f"DEBUG: Starting FFmpeg process (attempt {attempt + 1})...")
                 result = self._run_ffmpeg_process(
@@ -571,6 +933,8 @@ class FFMPEGEncoder:
 
                 if result:
                     return True  # Success!
+                elif stop_flag_callback and stop_flag_callback():
+                    return False  # Stopped by user, don't retry
                 elif attempt == 0:
                     print("DEBUG: First attempt failed, will try fallback...")
                     continue  # Try again with fallback
@@ -587,55 +951,220 @@ class FFMPEGEncoder:
 
         return False
 
+    def encode_video_segmented(
+        self,
+        input_path: str,
+        output_path: str,
+        settings: EncodingSettings,
+        progress_callback=None,
+        stop_flag_callback=None,
+        total_duration: Optional[float] = None,
+        threads: Optional[int] = None,
+        video_info: Optional[VideoInfo] = None,
+    ) -> bool:
+        """Encode a long file as segments in parallel, then join them."""
+        self._ensure_system_detected()
+
+        if video_info is None:
+            video_info = self.get_video_info(input_path)
+        if total_duration is None:
+            total_duration = video_info.duration if video_info else 0
+        optimal_threads = threads or (
+            self.optimal_settings.optimal_threads if self.optimal_settings else 8
+        )
+        workers = optimal_threads // self.SEGMENT_THREADS
+
+        # Hardware encoders cap concurrent sessions, remuxes have nothing to
+        # split and short files don't repay the extra keyframes
+        if (
+            workers < 2
+            or total_duration < 2 * self.SEGMENT_MIN_SECONDS
+            or self.select_video_encoder(settings.video_codec) != settings.video_codec
+            or self.can_stream_copy(settings, video_info)
+        ):
+            return self.encode_video(
+                input_path,
+                output_path,
+                settings,
+                progress_callback,
+                stop_flag_callback,
+                total_duration,
+                threads,
+                video_info,
+            )
+
+        # A couple of segments per worker evens out uneven GOP cuts
+        segment_time = max(self.SEGMENT_MIN_SECONDS, total_duration / (workers * 2))
+        output_dir = os.path.dirname(output_path)
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Keep the parts on the output's filesystem so the join doesn't copy
+        with tempfile.TemporaryDirectory(prefix=".hoffui-", dir=output_dir) as tmp:
+            parts = self._split_segments(
+                input_path, tmp, segment_time, stop_flag_callback
+            )
+            encoded = parts and self._encode_segments(
+                parts,
+                settings,
+                workers,
+                max(1, optimal_threads // workers),
+                total_duration,
+                progress_callback,
+                stop_flag_callback,
+            )
+            if encoded and self._concat_segments(
+                encoded, input_path, output_path, settings, tmp, stop_flag_callback
+            ):
+                return True
+
+        if stop_flag_callback and stop_flag_callback():
+            return False  # Stopped by user, don't retry
+        if DEBUG:
+            print("DEBUG: Segmented encode failed, encoding as a single file...")
+        return self.encode_video(
+            input_path,
+            output_path,
+            settings,
+            progress_callback,
+            stop_flag_callback,
+            total_duration,
+            threads,
+            video_info,
+        )
+
+    def _split_segments(
+        self, input_path: str, tmp_dir: str, segment_time: float, stop_flag_callback
+    ) -> List[str]:
+        """Cut the video stream at keyframes into parts, without re-encoding."""
+        pattern = os.path.join(tmp_dir, "part%03d.mkv")
+        cmd = [self.ffmpeg_path, "-i", input_path, "-map", "0:v:0", "-c", "copy"]
+        cmd.extend(["-f", "segment", "-segment_time", f"{segment_time:.3f}"])
+        cmd.extend(["-reset_timestamps", "1", "-y", pattern])
+        if not self._run_ffmpeg_process(cmd, 0, None, stop_flag_callback):
+            return []
+        return sorted(
+            entry.path for entry in os.scandir(tmp_dir) if entry.name.startswith("part")
+        )
+
+    def _encode_segments(
+        self,
+        parts: List[str],
+        settings: EncodingSettings,
+        workers: int,
+        part_threads: int,
+        total_duration: float,
+        progress_callback,
+        stop_flag_callback,
+    ) -> Optional[List[str]]:
+        """Encode the video parts in parallel; returns their paths, or None."""
+        # Parts carry video only; audio is encoded once when they are joined
+        part_settings = replace(settings, output_format="mkv")
+        tmp_dir = os.path.dirname(parts[0])
+        failed = Event()
+        done = [0.0] * len(parts)
+
+        def should_stop():
+            return failed.is_set() or bool(stop_flag_callback and stop_flag_callback())
+
+        def encode_part(index):
+            if should_stop():
+                return None
+            part = parts[index]
+            output = os.path.join(tmp_dir, "encoded_" + os.path.basename(part))
+
+            def on_progress(progress, status):
+                # Each part reports its encoded time against the whole file
+                done[index] = progress
+                overall = min(sum(done), 100)
+                progress_callback(overall, f"Encoding segments... {overall:.1f}%")
+
+            cmd = self.build_ffmpeg_command(part, output, part_settings, part_threads)
+            ok = self._run_ffmpeg_process(
+                cmd,
+                total_duration,
+                on_progress if progress_callback else None,
+                should_stop,
+            )
+            return output if ok else None
+
+        # ffmpeg does the work in its own process; pool threads only wait on it
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(encode_part, i) for i in range(len(parts))]
+            for future in as_completed(futures):
+                if future.result() is None:
+                    failed.set()
+        if failed.is_set():
+            return None
+        return [future.result() for future in futures]
+
+    def _concat_segments(
+        self,
+        encoded: List[str],
+        input_path: str,
+        output_path: str,
+        settings: EncodingSettings,
+        tmp_dir: str,
+        stop_flag_callback,
+    ) -> bool:
+        """Join encoded parts with the concat demuxer, adding the source audio."""
+        list_path = os.path.join(tmp_dir, "concat.txt")
+        with open(list_path, "w") as f:
+            for path in encoded:
+                escaped = path.replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        cmd = [self.ffmpeg_path, "-f", "concat", "-safe", "0", "-i", list_path]
+        cmd.extend(["-i", input_path, "-map", "0:v", "-map", "1:a?", "-c:v", "copy"])
+        cmd.extend(self._audio_args(settings))
+        cmd.extend(self._container_args(settings))
+        cmd.extend(["-y", output_path])
+        return self._run_ffmpeg_process(cmd, 0, None, stop_flag_callback)
+
     def _run_ffmpeg_process(
         self, cmd, total_duration, progress_callback, stop_flag_callback
     ):
         """Run the FFmpeg process and monitor progress."""
+        # Machine-readable key=value progress on stdout; stderr keeps only errors
+        cmd = [cmd[0], *self.PROGRESS_ARGS, *cmd[1:]]
+        # Pipes stay binary; only the stderr tail is ever decoded. ffmpeg
+        # watches stdin for keyboard commands, so keep it off the terminal
         process = subprocess.Popen(
             cmd,
+            stdin=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            universal_newlines=True,
         )
 
-        # Collect stderr for debugging
-        stderr_lines = []
+        # Drain stderr on a helper thread so a full pipe can't stall ffmpeg;
+        # the tail is kept for debugging
+        stderr_lines = deque(maxlen=10)
+        stderr_thread = Thread(
+            target=lambda: stderr_lines.extend(process.stderr),
+            daemon=True,
+        )
+        stderr_thread.start()
 
         # Monitor progress
-        while True:
+        for line in process.stdout:
             # Check if stop was requested
             if stop_flag_callback and stop_flag_callback():
-                process.terminate()
+                # The output path is always the last argument
+                self._stop_ffmpeg_process(process, cmd[-1])
                 return False
 
-            output = process.stderr.readline()
-            if output == "" and process.poll() is not None:
-                break
-
-            if output:
-                stderr_lines.append(output.strip())
-
-                if progress_callback and total_duration > 0:
-                    # Parse FFMPEG progress output
-                    if "time=" in output:
-                        try:
-                            time_str = output.split("time=")[1].split()[0]
-                            if ":" in time_str:
-                                time_parts = time_str.split(":")
-                                current_time = (
-                                    float(time_parts[0]) * 3600
-                                    + float(time_parts[1]) * 60
-                                    + float(time_parts[2])
-                                )
-                                progress = min(
-                                    (current_time / total_duration) * 100, 100
-                                )
-                                progress_callback(
-                                    progress, f"Encoding... {progress:.1f}%"
-                                )
-                        except Exception as e:
-                            print(f"Progress monitoring error: {e}")
+            key, _, value = line.strip().partition(b"=")
+            # out_time_us is "N/A" until the first frame is muxed
+            if (
+                key == b"out_time_us"
+                and value.isdigit()
+                and progress_callback
+                and total_duration > 0
+            ):
+                progress = min(int(value) / 1e6 / total_duration * 100, 100)
+                progress_callback(progress, f"Encoding... {progress:.1f}%")
+
+        process.wait()
+        stderr_thread.join()
 
         print("DEBUG: FFmpeg process completed")
         return_code = process.returncode
@@ -644,8 +1173,9 @@ class FFMPEGEncoder:
         if return_code != 0:
             # Print last few lines of stderr for debugging
             print("DEBUG: FFmpeg stderr output:")
-            for line in stderr_lines[-10:]:  # Show last 10 lines
-                if line.strip():
+            for line in stderr_lines:  # Last 10 lines
+                line = line.decode(errors="replace").strip()
+                if line:
                     print(f"  {line}")
 
             # Handle specific error codes
@@ -666,6 +1196,21 @@ class FFMPEGEncoder:
 
         return return_code == 0
 
+    def _stop_ffmpeg_process(self, process, output_path):
+        """Terminate ffmpeg, killing it after a grace period, and drop its partial output."""
+        process.terminate()
+        try:
+            process.wait(timeout=self.STOP_GRACE_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+        # A half-muxed file would look like a finished encode on the next run
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
+
     def get_output_path(
         self,
         input_path: str,
@@ -719,23 +1264,19 @@ class FFMPEGEncoder:
         """Format duration in seconds to human readable format."""
         if seconds < 60:
             return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            minutes = int(seconds // 60)
-            secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        if minutes < 60:
             return f"{minutes}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            minutes = int((seconds % 3600) // 60)
-            secs = int(seconds % 60)
-            return f"{hours}h {minutes}m {secs}s"
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}h {minutes}m {secs}s"
 
     def format_file_size(self, size_bytes: int) -> str:
         """Format file size in bytes to human readable format."""
-        if size_bytes < 1024:
+        size_bytes = int(size_bytes)
+        # Each unit is 2**10 of the last, so the bit length picks the unit
+        unit, divisor = self.SIZE_UNITS[
+            min(max(size_bytes.bit_length() - 1, 0) // 10, len(self.SIZE_UNITS) - 1)
+        ]
+        if divisor == 1:
             return f"{size_bytes} B"
-        elif size_bytes < 1024 * 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        elif size_bytes < 1024 * 1024 * 1024:
-            return f"{size_bytes / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+        return f"{size_bytes / divisor:.1f} {unit}"
@@ -29,6 +29,8 @@ Dependencies:
 """
 
 import sys
+import threading
+from functools import cached_property
 from signal import SIGINT, signal
 
 import ttkbootstrap as ttk
@@ -52,6 +54,8 @@ class HoffUIEncoder(ttk.Window):
         self._initialize_variables()
         self._setup_gui()
         self._show()
+        # Build the encoder on the Tk thread once the window has painted
+        self.after_idle(self._load_encoder)
 
     def _setup_window(self):
         self.bind_all("<Control-c>", self.on_closing)
@@ -65,12 +69,37 @@ class HoffUIEncoder(ttk.Window):
 
         # Initialize managers
         self.thread_manager = ThreadManager(self)
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
 
     def _setup_gui(self):
         Gui.main_ui(self)
 
+    @property
+    def encoder(self):
+        """FFMPEG encoder, created once after first paint so startup skips the probe."""
+        with self._encoder_lock:
+            if self._encoder is None:
+                self._encoder = FFMPEGEncoder()
+            return self._encoder
+
+    def _load_encoder(self):
+        try:
+            self.encoder
+        except RuntimeError as e:
+            # Nothing works without ffmpeg; say why rather than fail in a worker
+            Messagebox.show_error(title="FFMPEG Not Found", message=str(e))
+            self.on_closing()
+
+    @cached_property
+    def ai_analyzer(self):
+        """AI analyzer, imported on first use to keep the OpenAI SDK off startup."""
+        from openai_analyzer import OpenAIVideoAnalyzer
+
+        return OpenAIVideoAnalyzer()
+
     def is_not_blank(self, s):
-        return bool(s and not s.isspace())
+        return func.is_not_blank(s)
 
     def on_closing(self):
         """Handle application closing with proper cleanup."""
@@ -89,7 +118,8 @@ class HoffUIEncoder(ttk.Window):
         self.withdraw()
 
     def _show(self):
-        self.update()
+        # Settle geometry once for the whole widget tree before mapping the window
+        self.update_idletasks()
         self.deiconify()
 
     def messageBox(self, title, message):
@@ -389,6 +389,9 @@ ENCODING GUIDELINES:
         else:  # moderate
             optimized.audio_bitrate = "160k"  # Balanced bitrate (reduced from 192k)
 
+        # Auto-variance AQ, biased towards dark areas only where they need it
+        optimized.aq_mode = 3 if analysis.has_dark_scenes else 2
+
         # Additional optimizations for file size reduction
         if analysis.complexity_score < 0.5:
             # Low complexity content can use higher CRF (smaller file)
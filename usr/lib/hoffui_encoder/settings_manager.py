@@ -30,6 +30,7 @@ Dependencies:
 import os
 import json
 import platform
+import tempfile
 from pathlib import Path
 from typing import Dict, Optional
 from dataclasses import dataclass, asdict
@@ -64,6 +65,9 @@ class AppSettings:
     output_directory: str = ""
     maintain_structure: bool = True
     overwrite_files: bool = False
+    copy_matching_streams: bool = False
+    parallel_jobs: int = 1
+    segment_encode: bool = False
 
     # App preferences
     load_settings_on_startup: bool = True
@@ -163,8 +167,17 @@ class SettingsManager:
                     }
                 )
 
-            with open(self.config_file, "w") as f:
-                json.dump(save_data, f, indent=2)
+            # Write a uniquely named temp file and swap it in, so a crash never
+            # leaves half a file and concurrent saves can't share a temp file
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.config_dir, suffix=".tmp", delete=False
+            ) as f:
+                f.write(json.dumps(save_data, indent=2))
+            try:
+                os.replace(f.name, self.config_file)
+            except OSError:
+                os.remove(f.name)
+                raise
 
             if DEBUG:
                 print(f"Settings saved to: {self.config_file}")
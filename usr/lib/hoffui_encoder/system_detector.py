@@ -28,13 +28,30 @@ Dependencies:
 """
 
 import os
+import shutil
 import subprocess
 import psutil
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 from Functions import DEBUG
 
 
+@lru_cache(maxsize=None)
+def find_ffmpeg() -> Optional[str]:
+    """Find the FFMPEG executable, once per process."""
+    # Try PATH, then common install locations, without spawning anything
+    common_paths = (
+        "/usr/bin/ffmpeg",
+        "/usr/local/bin/ffmpeg",
+        "/opt/homebrew/bin/ffmpeg",
+        "/opt/ffmpeg/bin/ffmpeg",
+    )
+    return shutil.which("ffmpeg") or next(
+        (path for path in common_paths if os.path.exists(path)), None
+    )
+
+
 @dataclass
 class SystemSpecs:
     """Data class to hold system specifications."""
@@ -85,39 +102,13 @@ class OptimalSettings:
 class SystemDetector:
     """Detects system capabilities and calculates optimal encoding settings."""
 
-    def __init__(self):
-        self.ffmpeg_path = self._find_ffmpeg()
+    def __init__(self, ffmpeg_path: Optional[str] = None):
+        self.ffmpeg_path = ffmpeg_path or find_ffmpeg()
         if not self.ffmpeg_path:
             raise RuntimeError(
                 "FFMPEG not found. Please install FFMPEG and add it to PATH."
             )
 
-    def _find_ffmpeg(self) -> Optional[str]:
-        """Find FFMPEG executable in system PATH."""
-        try:
-            result = subprocess.run(["which", "ffmpeg"], capture_output=True, text=True)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-
-        # Try common paths
-        common_paths = [
-            "/usr/bin/ffmpeg",
-            "/usr/local/bin/ffmpeg",
-            "/opt/homebrew/bin/ffmpeg",
-            "ffmpeg",
-        ]
-
-        for path in common_paths:
-            try:
-                subprocess.run([path, "-version"], capture_output=True, timeout=5)
-                return path
-            except Exception:
-                continue
-
-        return None
-
     def detect_cpu_info(self) -> Dict:
         """Detect CPU information."""
         try:
@@ -362,7 +353,7 @@ class SystemDetector:
         hw_decoder = None
         hw_encoder = None
 
-        # Priority: NVENC > VAAPI > QSV > Software
+        # Priority: NVENC > VAAPI > QSV > VideoToolbox > Software
         if any("nvidia" in gpu.lower() for gpu in system_specs.gpu_info):
             if "cuda" in system_specs.hw_acceleration:
                 preferred_hwaccel = "cuda"
@@ -379,6 +370,11 @@ class SystemDetector:
             hw_decoder = "qsv"
             if "h264_qsv" in system_specs.ffmpeg_encoders:
                 hw_encoder = "h264_qsv"
+        elif "videotoolbox" in system_specs.hw_acceleration:
+            preferred_hwaccel = "videotoolbox"
+            hw_decoder = "videotoolbox"
+            if "h264_videotoolbox" in system_specs.ffmpeg_encoders:
+                hw_encoder = "h264_videotoolbox"
 
         # Performance settings based on system capabilities
         if memory_gb >= 16: